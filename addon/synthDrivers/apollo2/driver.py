@@ -1,12 +1,16 @@
 # -*- coding: UTF-8 -*-
 from __future__ import annotations
 
+import array
+import functools
+import logging
 import queue
+import re
 import threading
 import time
-from collections import OrderedDict, deque
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from typing import NamedTuple, Optional, Sequence
 
 import addonHandler
 from autoSettingsUtils.driverSetting import BooleanDriverSetting, DriverSetting
@@ -47,6 +51,13 @@ except ImportError:
 	from . import cserial as serial  # type: ignore[no-redef]
 	from .cserial import rs485  # type: ignore[no-redef]
 
+# Resolved once; writes check for it on every failure. Fall back to a class nothing raises.
+_SerialTimeoutException: type[Exception] = getattr(
+	serial,
+	"SerialTimeoutException",
+	type("_SerialTimeoutExceptionUnavailable", (Exception,), {}),
+)
+
 try:
 	import languageHandler  # type: ignore[import-not-found]
 except ImportError:
@@ -67,7 +78,26 @@ _SUPPORTED_BAUD_RATES = (9600,)
 # from going silent and lets it keep using the previously selected synthesizer.
 _INITIAL_CONNECT_MAX_SECONDS = 2.0
 _BAUD_RATE_TO_APOLLO_SELECTOR: dict[int, str] = {9600: "3"}
+# @Y command variants per target baud rate, in the order they are tried. Each one is preceded by a
+# mute so the synth is quiet before the handshake; like the cancel path's mute + @I+, both go out
+# in one write.
+_Y_BAUD_SWITCH_COMMANDS: dict[int, tuple[bytes, ...]] = {
+	baudRate: tuple(
+		_MUTE + command.encode("ascii")
+		for command in (
+			# Compact form first (some firmware expects no separators).
+			f"@Yf{selector}N8",
+			f"@YF{selector}N8",
+			# Documented form (with separators).
+			f"@Y f {selector} N 8",
+			f"@Y F {selector} N 8",
+		)
+	)
+	for baudRate, selector in _BAUD_RATE_TO_APOLLO_SELECTOR.items()
+}
 _INDEX_POLL_INTERVAL_SECONDS = 0.10
+# While nothing is pending the poll thread sleeps until speech is written; this is only a backstop.
+_INDEX_POLL_IDLE_WAIT_SECONDS = 1.0
 _ROM_INFO_REQUEST_MIN_INTERVAL_SECONDS = 5.0
 _ROM_INFO_REQUEST_TIMEOUT_SECONDS = 2.0
 _Y_BAUD_SWITCH_MAX_SECONDS = 1.5
@@ -75,6 +105,18 @@ _Y_BAUD_SWITCH_PROBE_TIMEOUT_SECONDS = 0.25
 # Smaller chunks improve responsiveness when cancelling speech (more frequent generation checks)
 # while staying well within typical USB-serial driver buffering.
 _WRITE_CHUNK_SIZE = 64
+# Upper bound for coalescing queued setting commands into one write. The batch still goes out in
+# _WRITE_CHUNK_SIZE chunks (each with its own write timeout), but under one _serialIoLock hold with no
+# cancel check, so two chunks (~0.13 s of line time at 9600 baud) keep speech from waiting long behind it.
+_WRITE_BATCH_MAX_SIZE = 128
+# Bytes skipped while scanning for a probe response.
+_PROBE_NOISE_BYTES = b"\x00" + _NAK
+# First bytes of the unsolicited responses handled by the read loop.
+_RESPONSE_INDEX = ord("I")
+_RESPONSE_LANGUAGE_LIST = ord("L")
+_RESPONSE_START_RE = re.compile(rb"[IL]")
+_HEX_DIGITS = frozenset(b"0123456789abcdefABCDEF")
+_LANGUAGE_LIST_SEPARATORS = frozenset(b", \t\r\n")
 _OFFLINE_WRITE_MAX_AGE_SECONDS = 10.0
 _OFFLINE_WRITE_RETRY_INTERVAL_SECONDS = 0.25
 _SETTINGS_SYNC_DEBOUNCE_SECONDS = 0.05
@@ -96,12 +138,33 @@ _MIN_WORD_PAUSE = 0
 _MAX_WORD_PAUSE = 9
 _MIN_MARK_SPACE_RATIO = 0
 _MAX_MARK_SPACE_RATIO = 0x3F
+
+# Pre-encoded setting commands, indexed by the raw parameter value. The trailing space delimits the
+# command so following text/commands can't join it.
+_RATE_COMMANDS = tuple(f"@W{v} ".encode("ascii") for v in range(_MAX_RATE + 1))
+_PITCH_COMMANDS = tuple(f"@F{v:X} ".encode("ascii") for v in range(_MAX_PITCH + 1))
+_VOLUME_COMMANDS = tuple(f"@A{v:X} ".encode("ascii") for v in range(_MAX_VOLUME + 1))
+_INFLECTION_COMMANDS = tuple(f"@R{v} ".encode("ascii") for v in range(_MAX_INFLECTION + 1))
+_VOICING_COMMANDS = tuple(f"@B{v} ".encode("ascii") for v in range(_MAX_VOICING + 1))
+_SENTENCE_PAUSE_COMMANDS = tuple(f"@D{v:X} ".encode("ascii") for v in range(_MAX_SENTENCE_PAUSE + 1))
+_WORD_PAUSE_COMMANDS = tuple(f"@Q{v} ".encode("ascii") for v in range(_MAX_WORD_PAUSE + 1))
+_MARK_SPACE_RATIO_COMMANDS = tuple(f"@M{v:02X} ".encode("ascii") for v in range(_MAX_MARK_SPACE_RATIO + 1))
+# On/off commands, indexed by `int(flag)`.
+_PUNCTUATION_COMMANDS = (b"@P0 ", b"@P1 ")
+_SPELL_MODE_COMMANDS = (b"@S0 ", b"@S1 ")
+_HYPERMODE_COMMANDS = (b"@H0 ", b"@H1 ")
+_PHONETIC_MODE_COMMANDS = (b"@X0 ", b"@X1 ")
+
 _FORMANT_DELTA_UI_DEFAULT_MAX_ABS = 50
+_ZERO_FORMANT_DELTAS: tuple[int, ...] = (0,) * 10
 # Apply formant tweaks as soon as possible. A previous debounce here made adjustments feel
 # inconsistent (the spoken value could be rendered before the new setting took effect) and could
 # temporarily stall speech while the write thread waited for the debounce window.
 _FORMANT_SYNC_DEBOUNCE_SECONDS = 0.0
 _DELAYED_CHARACTER_DESCRIPTION_BREAK_MS = 1000
+# One @Tx pause per 100 ms of a break, with or without a delimiting space.
+_BREAK_COMMAND = b"@Tx "
+_BREAK_COMMAND_UNDELIMITED = b"@Tx"
 _DRIVER_CONFIG_VERSION = 2
 
 _INTERNAL_DONE_INDEX = -1
@@ -109,8 +172,7 @@ _NVDA_STARTUP_ANNOUNCE_WINDOW_SECONDS = 30.0
 _nvdaStartupAnnounced = False
 
 
-@dataclass(frozen=True)
-class _WriteItem:
+class _WriteItem(NamedTuple):
 	data: bytes
 	indexes: tuple[int, ...] = ()
 	generation: int = 0
@@ -182,6 +244,8 @@ def _apolloLanguageCodeToNvdaLanguage(languageCode: str) -> Optional[str]:
 	return _CALLING_CODE4_TO_NVDA_LANGUAGE.get(callingCode4)
 
 
+# NVDA only changes its interface language on restart, so descriptions can be cached for the session.
+@functools.lru_cache(maxsize=64)
 def _getLanguageDisplayName(nvdaLanguage: Optional[str], fallback: str) -> str:
 	if nvdaLanguage and languageHandler:
 		try:
@@ -191,8 +255,93 @@ def _getLanguageDisplayName(nvdaLanguage: Optional[str], fallback: str) -> str:
 	return nvdaLanguage or fallback
 
 
-def _hexDigit(value: int) -> str:
-	return f"{value:X}"
+# Manual: voices 1-3 are male-based, 4-6 are non-male-based.
+#
+# In "auto" voice filter mode, we map each voice to a distinct voice source/filter (`@$o`)
+# so the Voice selection yields clearly different timbres on ROMs where @V voices are similar.
+_VOICES: dict[str, VoiceInfo] = {
+	"1": VoiceInfo("1", _("Voice 1 (male default)")),
+	"2": VoiceInfo("2", _("Voice 2 (male spike)")),
+	"3": VoiceInfo("3", _("Voice 3 (male reduced high-frequency filter)")),
+	"4": VoiceInfo("4", _("Voice 4 (female default)")),
+	"5": VoiceInfo("5", _("Voice 5 (female spike)")),
+	"6": VoiceInfo("6", _("Voice 6 (female reduced high-frequency filter)")),
+}
+
+_BAUD_RATE_CHOICES: dict[str, StringParameterInfo] = {
+	str(rate): StringParameterInfo(
+		str(rate),
+		# Translators: Shown after the baud rate that Apollo uses after power-up.
+		f"{rate} ({_('default')})" if rate == _DEFAULT_BAUD_RATE else f"{rate}",
+	)
+	for rate in _SUPPORTED_BAUD_RATES
+}
+
+# Fixed choice lists for the numeric combo boxes. NVDA queries these on every Voice Settings
+# refresh, so they're built once; `_choicesWithCurrent` only copies when an unknown value is set.
+_MARK_SPACE_RATIO_CHOICES: dict[str, StringParameterInfo] = {
+	str(ratio): StringParameterInfo(str(ratio), f"{ratio} (0x{ratio:02X})")
+	for ratio in range(_MIN_MARK_SPACE_RATIO, _MAX_MARK_SPACE_RATIO + 1)
+}
+_SENTENCE_PAUSE_CHOICES: dict[str, StringParameterInfo] = {
+	str(pause): StringParameterInfo(str(pause), f"{pause} (0x{pause:X})")
+	for pause in range(_MIN_SENTENCE_PAUSE, _MAX_SENTENCE_PAUSE + 1)
+}
+_WORD_PAUSE_CHOICES: dict[str, StringParameterInfo] = {
+	str(pause): StringParameterInfo(str(pause), str(pause))
+	for pause in range(_MIN_WORD_PAUSE, _MAX_WORD_PAUSE + 1)
+}
+_VOICING_CHOICES: dict[str, StringParameterInfo] = {
+	str(voicing): StringParameterInfo(str(voicing), str(voicing))
+	for voicing in range(_MIN_VOICING, _MAX_VOICING + 1)
+}
+
+
+def _choicesWithCurrent(
+	choices: dict[str, StringParameterInfo],
+	current: str,
+) -> dict[str, StringParameterInfo]:
+	if not current or current in choices:
+		return choices
+	return {**choices, current: StringParameterInfo(current, current)}
+
+
+@functools.cache
+def _formantDeltaChoices(maxAbs: int) -> dict[str, StringParameterInfo]:
+	# Up to 511 entries; shared by all ten formant settings and every driver instance.
+	values: dict[str, StringParameterInfo] = {}
+	for delta in range(-maxAbs, maxAbs + 1):
+		key = str(delta)
+		if delta > 0:
+			display = f"+{delta}"
+		elif delta == 0:
+			# Translators: Displayed in formant tuning lists; indicates the default (no change).
+			display = _("0 (default)")
+		else:
+			display = key
+		values[key] = StringParameterInfo(key, display)
+	return values
+
+
+def _formantDeltaGetter(index: int) -> Callable[[SynthDriver], str]:
+	def getter(self: SynthDriver) -> str:
+		return str(int(self._formantDeltas[index]))
+
+	return getter
+
+
+def _formantDeltaSetter(index: int) -> Callable[[SynthDriver, str | int], None]:
+	def setter(self: SynthDriver, value: str | int) -> None:
+		self._setFormantDelta(index, value)
+
+	return setter
+
+
+def _formantDeltaChoicesGetter(index: int) -> Callable[[SynthDriver], dict[str, StringParameterInfo]]:
+	def getter(self: SynthDriver) -> dict[str, StringParameterInfo]:
+		return self._get_availableFormantDeltaValuesForIndex(index)
+
+	return getter
 
 
 class SynthDriver(BaseSynthDriver):
@@ -432,6 +581,8 @@ class SynthDriver(BaseSynthDriver):
 
 		self._settingsRevision = 0
 		self._settingsLastChangedAt = 0.0
+		# (settingsRevision, settings part of the last `_settingsPrefix` build)
+		self._settingsPrefixCache: Optional[tuple[int, bytes]] = None
 		self._settingsSyncQueued = False
 		self._needsSettingsSync = True
 		self._needsRomSwitch = False
@@ -439,16 +590,26 @@ class SynthDriver(BaseSynthDriver):
 		self._formantRevision = 0
 		self._formantSyncDueAt = 0.0
 
-		self._writeQueue: queue.Queue[Optional[_WriteItem]] = queue.Queue()
+		# Only the write thread consumes this queue and we never use task tracking, so the C-implemented
+		# SimpleQueue is enough (cheaper put/get than queue.Queue's Python-level locking).
+		self._writeQueue: queue.SimpleQueue[Optional[_WriteItem]] = queue.SimpleQueue()
 		self._stopEvent = threading.Event()
 		self._cancelGeneration = 0
 
 		self._indexLock = threading.Lock()
-		self._pendingIndexes: deque[int] = deque()
+		# Indexes sent to the synth but not reached yet are `_pendingIndexes[_pendingHead:]`; reached
+		# entries are skipped by advancing the head and compacted away in bulk. Stored as C integers:
+		# long Say All runs keep many marks pending.
+		self._pendingIndexes = array.array("q")
+		self._pendingHead = 0
 		self._isSpeaking = False
 
 		self._pollSuspendLock = threading.Lock()
 		self._pollSuspendUntil = 0.0
+		# Set when speech with index marks has been written, so the idle poll thread starts polling.
+		self._pollWakeEvent = threading.Event()
+		# Serial line time per byte (start + 8 data + stop bits) at the connected baud rate.
+		self._secondsPerByte = 10.0 / _DEFAULT_BAUD_RATE
 
 		self._romInfoLock = threading.Lock()
 		self._romInfoBySlot: dict[str, _RomSlotInfo] = {}
@@ -472,8 +633,11 @@ class SynthDriver(BaseSynthDriver):
 		self._speakerTable = _AUTO_SETTING
 		self._voiceFilter = _AUTO_SETTING
 		self._formantDeltaUiRange = str(_FORMANT_DELTA_UI_DEFAULT_MAX_ABS)
-		self._formantDeltas = [0] * 10
-		self._formantDeltasApplied = [0] * 10
+		# Parsed form of `_formantDeltaUiRange`, kept in sync by its setter.
+		self._formantDeltaUiMaxAbs = _FORMANT_DELTA_UI_DEFAULT_MAX_ABS
+		# Immutable so the write thread can snapshot them without copying; setters swap in a new tuple.
+		self._formantDeltas: tuple[int, ...] = _ZERO_FORMANT_DELTAS
+		self._formantDeltasApplied: tuple[int, ...] = _ZERO_FORMANT_DELTAS
 		self._needsSoftReset = True
 		# Revision marker for soft reset requests to avoid races between the UI thread (changing settings)
 		# and the write thread clearing the flag after a sync.
@@ -536,6 +700,7 @@ class SynthDriver(BaseSynthDriver):
 						if str(self._voiceFilter).strip() == "0":
 							log.info("Apollo: migrating legacy voiceFilter=0 to auto for better voice selection.")
 							self._voiceFilter = _AUTO_SETTING
+							self._touchSettingsRevision()
 							try:
 								driverSection["voiceFilter"] = _AUTO_SETTING
 							except Exception:
@@ -614,13 +779,17 @@ class SynthDriver(BaseSynthDriver):
 		isFormantSync: bool = False,
 		isMute: bool = False,
 	) -> None:
+		if not data and not indexes and not (includesSettings or isSettingsSync or isFormantSync or isMute):
+			# Nothing for the write thread to do; don't wake it.
+			return
 		if not self._stopEvent.is_set():
 			self._writeQueue.put(
 				_WriteItem(
 					data=data,
 					indexes=indexes,
 					generation=self._cancelGeneration,
-					createdAt=time.monotonic(),
+					# Only cancelable items are aged out while offline; skip the clock read for the rest.
+					createdAt=time.monotonic() if cancelable else 0.0,
 					includesSettings=includesSettings,
 					cancelable=cancelable,
 					isSettingsSync=isSettingsSync,
@@ -639,8 +808,9 @@ class SynthDriver(BaseSynthDriver):
 			with self._serialLock:
 				ser = self._serial
 				self._serial = None
+				self._secondsPerByte = 10.0 / _DEFAULT_BAUD_RATE
 		self._needsSoftReset = True
-		self._formantDeltasApplied = [0] * 10
+		self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 		self._requireSettingsSync()
 		if ser is not None:
 			# Abort any in-flight I/O so close doesn't block and pending writes don't delay later speech.
@@ -795,20 +965,14 @@ class SynthDriver(BaseSynthDriver):
 					candidates = []
 				# Prefer the last successfully detected port (if any) to avoid scanning.
 				cached = (self._lastDetectedPort or "").strip()
-				if cached and cached in candidates:
-					candidates.remove(cached)
-					candidates.insert(0, cached)
-				if _DEFAULT_PORT not in candidates:
-					candidates.append(_DEFAULT_PORT)
-				seen: set[str] = set()
-				result: list[str] = []
-				for p in candidates:
-					p = (p or "").strip()
-					if not p or p in seen or p == _AUTO_PORT:
-						continue
-					seen.add(p)
-					result.append(p)
-				return tuple(result) if result else (_DEFAULT_PORT,)
+				ordered = [cached] if cached and cached in candidates else []
+				ordered.extend(candidates)
+				ordered.append(_DEFAULT_PORT)
+				# dict.fromkeys() de-duplicates while preserving order.
+				result = tuple(
+					p for p in dict.fromkeys((p or "").strip() for p in ordered) if p and p != _AUTO_PORT
+				)
+				return result if result else (_DEFAULT_PORT,)
 
 			def openSerial(port: str, baudRate: int) -> Optional[serial.Serial]:  # type: ignore[misc]
 				# Keep write timeouts short but realistic: a single chunk must be able to leave the OS
@@ -874,6 +1038,44 @@ class SynthDriver(BaseSynthDriver):
 					except Exception:
 						return False
 
+			def discardPendingInput(ser: serial.Serial) -> None:  # type: ignore[misc]
+				# The input buffer is purged once in openSerial(). Before each probe, only drop bytes that
+				# arrived since then instead of issuing another purge (a kernel round-trip per probe).
+				try:
+					pending = ser.in_waiting
+					if pending:
+						ser.read(pending)
+				except Exception:
+					pass
+
+			def readProbeResponse(
+				ser: serial.Serial,  # type: ignore[misc]
+				*,
+				prefix: bytes,
+				length: int,
+				deadline: float,
+			) -> Optional[bytes]:
+				"""Return the `length` bytes following `prefix`, or None on timeout/read failure."""
+				received = bytearray()
+				while time.monotonic() < deadline and not self._stopEvent.is_set():
+					try:
+						# Block for at most one byte, then take whatever else has already arrived.
+						block = ser.read(max(1, ser.in_waiting))
+					except Exception:
+						return None
+					if not block:
+						continue
+					# Drop NAK/NUL noise (common at the wrong baud rate) and search in C, not per byte.
+					received += block.translate(None, _PROBE_NOISE_BYTES)
+					start = received.find(prefix)
+					if start < 0:
+						received.clear()
+						continue
+					del received[:start]
+					if len(received) >= len(prefix) + length:
+						return bytes(received[len(prefix) : len(prefix) + length])
+				return None
+
 			def probeIndexResponseDirect(
 				ser: serial.Serial,
 				*,
@@ -886,36 +1088,18 @@ class SynthDriver(BaseSynthDriver):
 						return False
 					timeout = min(timeout, remaining)
 				# Probe Apollo indexing without relying on the background read thread.
-				try:
-					ser.reset_input_buffer()
-				except Exception:
-					pass
+				discardPendingInput(ser)
 				if not writeAndFlush(ser, command):
 					return False
-				deadline = time.monotonic() + timeout
-				while time.monotonic() < deadline and not self._stopEvent.is_set():
-					try:
-						first = ser.read(1)
-					except Exception:
-						return False
-					if not first or first == _NAK:
-						continue
-					if first != b"I":
-						continue
-					try:
-						rest = ser.read(3)
-					except Exception:
-						return False
-					if len(rest) != 3:
-						return False
-					# Validate the response shape to avoid false positives at the wrong baud rate.
-					hexDigits = b"0123456789abcdefABCDEF"
-					if rest[0:1] not in hexDigits or rest[1:2] not in hexDigits:
-						return False
-					if rest[2:3] not in (b"T", b"M", b"t", b"m"):
-						return False
-					return True
-				return False
+				rest = readProbeResponse(ser, prefix=b"I", length=3, deadline=time.monotonic() + timeout)
+				if rest is None:
+					return False
+				# Validate the response shape to avoid false positives at the wrong baud rate.
+				if not _is_hex_digit_byte(rest[0:1]) or not _is_hex_digit_byte(rest[1:2]):
+					return False
+				if rest[2:3] not in (b"T", b"M", b"t", b"m"):
+					return False
+				return True
 
 			def probeSettingResponseDirect(
 				ser: serial.Serial,
@@ -930,41 +1114,19 @@ class SynthDriver(BaseSynthDriver):
 					if remaining <= 0:
 						return False
 					timeout = min(timeout, remaining)
-				try:
-					ser.reset_input_buffer()
-				except Exception:
-					pass
+				discardPendingInput(ser)
 				# Some firmware variants only process "@c?" queries after a delimiter, so include a
 				# trailing space.
 				if not writeAndFlush(ser, command + b" "):
 					return False
-				deadline = time.monotonic() + timeout
-				while time.monotonic() < deadline and not self._stopEvent.is_set():
-					try:
-						first = ser.read(1)
-					except Exception:
-						return False
-					if not first or first == _NAK:
-						continue
-					if first != expectedPrefix:
-						continue
-					try:
-						rest = ser.read(2)
-					except Exception:
-						return False
-					if len(rest) != 2:
-						return False
-					if not _is_hex_digit_byte(rest[0:1]) or not _is_hex_digit_byte(rest[1:2]):
-						return False
-					return True
-				return False
+				rest = readProbeResponse(ser, prefix=expectedPrefix, length=2, deadline=time.monotonic() + timeout)
+				if rest is None:
+					return False
+				if not _is_hex_digit_byte(rest[0:1]) or not _is_hex_digit_byte(rest[1:2]):
+					return False
+				return True
 
-			def ensureIndexingAndProbe(
-				ser: serial.Serial,
-				*,
-				port: str,
-				baudRate: int,
-			) -> bool:  # type: ignore[misc]
+			def ensureIndexingAndProbe(ser: serial.Serial) -> bool:  # type: ignore[misc]
 				probeTimeout = 0.35 if overallDeadline is None else 0.25
 
 				def tryIndexingProbe(*, query: bytes, enable: bytes) -> bool:
@@ -1003,8 +1165,8 @@ class SynthDriver(BaseSynthDriver):
 				if targetBaud == currentBaud:
 					log.info(f"Apollo: @Y switch not needed; already at {targetBaud}.")
 					return currentBaud
-				selector = _BAUD_RATE_TO_APOLLO_SELECTOR.get(targetBaud)
-				if selector is None:
+				baudCommands = _Y_BAUD_SWITCH_COMMANDS.get(targetBaud)
+				if baudCommands is None:
 					log.warning(f"Apollo: baud {targetBaud} has no @Y selector; staying at {currentBaud}.")
 					return currentBaud
 
@@ -1020,20 +1182,14 @@ class SynthDriver(BaseSynthDriver):
 				# seconds when probing at the wrong baud rate. A long @Y attempt delays speech startup
 				# and feels like NVDA has frozen.
 				handshakeDeadline = time.monotonic() + _Y_BAUD_SWITCH_MAX_SECONDS
-				baudCommands = (
-					# Compact form first (some firmware expects no separators).
-					f"@Yf{selector}N8".encode("ascii", "ignore"),
-					f"@YF{selector}N8".encode("ascii", "ignore"),
-					# Documented form (with separators).
-					f"@Y f {selector} N 8".encode("ascii", "ignore"),
-					f"@Y F {selector} N 8".encode("ascii", "ignore"),
-				)
 				syncPayload = b"\x55" * 5
 
 				switchSucceeded = False
-				prevTimeout = getattr(ser, "timeout", None)
-				prevWriteTimeout = getattr(ser, "write_timeout", None)
+				prevTimeout: Optional[float] = None
+				prevWriteTimeout: Optional[float] = None
 				try:
+					prevTimeout = ser.timeout
+					prevWriteTimeout = ser.write_timeout
 					# Reduce timeouts while probing so a failing @Y attempt can't stall NVDA for long.
 					ser.timeout = min(prevTimeout or _Y_BAUD_SWITCH_PROBE_TIMEOUT_SECONDS, _Y_BAUD_SWITCH_PROBE_TIMEOUT_SECONDS)
 					ser.write_timeout = min(
@@ -1048,9 +1204,6 @@ class SynthDriver(BaseSynthDriver):
 						if time.monotonic() > handshakeDeadline:
 							break
 
-						# Ensure the synth is quiet before the @Y handshake.
-						writeAndFlush(ser, _MUTE)
-						time.sleep(0.01)
 						if not writeAndFlush(ser, baudCommand):
 							continue
 
@@ -1160,6 +1313,7 @@ class SynthDriver(BaseSynthDriver):
 				self._connectBackoffUntil = 0.0
 				with self._serialLock:
 					self._serial = ser
+					self._secondsPerByte = 10.0 / (baudRate or _DEFAULT_BAUD_RATE)
 					log.info(
 						"Apollo indexing commands: query=%r enable=%r mark=%r",
 						self._indexQueryCommand,
@@ -1203,7 +1357,7 @@ class SynthDriver(BaseSynthDriver):
 						ser = openSerial(port, baudRate)
 						if ser is None:
 							continue
-						if ensureIndexingAndProbe(ser, port=port, baudRate=baudRate):
+						if ensureIndexingAndProbe(ser):
 							finalBaud = baudRate
 							switched = trySwitchSynthBaudRate(ser, port=port, currentBaud=baudRate)
 							if switched is None:
@@ -1244,12 +1398,8 @@ class SynthDriver(BaseSynthDriver):
 			self._pollSuspendUntil = max(self._pollSuspendUntil, until)
 
 	def _suspendPollingAfterWrite(self, byteCount: int) -> None:
-		# Serial line time ≈ bytes * (start + 8 data + stop) / baud.
 		# Add a small safety margin to avoid polling before the synth has received the whole chunk.
-		ser = self._getSerial()
-		baud = getattr(ser, "baudrate", None) if ser is not None else None
-		seconds = (byteCount * 10) / (baud or _DEFAULT_BAUD_RATE) + 0.05
-		until = time.monotonic() + seconds
+		until = time.monotonic() + byteCount * self._secondsPerByte + 0.05
 		with self._pollSuspendLock:
 			self._pollSuspendUntil = max(self._pollSuspendUntil, until)
 
@@ -1262,8 +1412,6 @@ class SynthDriver(BaseSynthDriver):
 			generation: int,
 			flush: bool = False,
 		) -> bool:
-			SerialTimeoutException = getattr(serial, "SerialTimeoutException", None)
-
 			def noteWriteTimeout() -> None:
 				self._serialWriteTimeoutCount += 1
 				backoff = min(
@@ -1274,6 +1422,8 @@ class SynthDriver(BaseSynthDriver):
 
 			if not data:
 				return True
+			# Resolve the bound method once per item rather than once per chunk.
+			write = ser.write
 			if flush:
 				# Serialize the whole write+flush so cancel() can't drop non-cancelable settings bytes
 				# from the OS TX buffer (this would desynchronize formant tuning and other settings).
@@ -1283,13 +1433,13 @@ class SynthDriver(BaseSynthDriver):
 					try:
 						for offset in range(0, len(data), _WRITE_CHUNK_SIZE):
 							chunk = data[offset : offset + _WRITE_CHUNK_SIZE]
-							ser.write(chunk)
+							write(chunk)
 						try:
 							ser.flush()
 						except Exception:
 							pass
 					except Exception as e:
-						if SerialTimeoutException is not None and isinstance(e, SerialTimeoutException):
+						if isinstance(e, _SerialTimeoutException):
 							noteWriteTimeout()
 						log.debugWarning("Apollo serial write failed", exc_info=True)
 						self._disconnect()
@@ -1303,20 +1453,77 @@ class SynthDriver(BaseSynthDriver):
 					if cancelable and generation != self._cancelGeneration:
 						return False
 					try:
-						ser.write(chunk)
+						write(chunk)
 					except Exception as e:
-						if SerialTimeoutException is not None and isinstance(e, SerialTimeoutException):
+						if isinstance(e, _SerialTimeoutException):
 							noteWriteTimeout()
 						log.debugWarning("Apollo serial write failed", exc_info=True)
 						self._disconnect()
 						return False
+				# Suspend per written chunk: a cancel between chunks must not leave polling blocked for
+				# bytes that were never sent.
 				self._suspendPollingAfterWrite(len(chunk))
 			return True
+
+		def isBatchable(item: _WriteItem) -> bool:
+			# Speech (which carries indexes) and the special sync/mute items keep their own writes.
+			return not (item.indexes or item.isMute or item.isSettingsSync or item.isFormantSync)
+
+		def coalesce(item: _WriteItem) -> tuple[_WriteItem, Optional[_WriteItem]]:
+			"""Append queued items compatible with `item` to its data.
+
+			Returns the combined item and the first incompatible item taken off the queue, if any;
+			that one must be handled next to preserve ordering.
+			"""
+			parts = [item.data]
+			size = len(item.data)
+			heldItem = None
+			while True:
+				try:
+					extra = self._writeQueue.get_nowait()
+				except queue.Empty:
+					break
+				if extra is None:
+					# Shutdown sentinel: leave it for the main loop.
+					self._writeQueue.put(None)
+					break
+				if extra is item:
+					# The poll thread re-queues one cached index query; back-to-back copies (the write
+					# thread fell behind) would only get the same answer twice.
+					continue
+				if (
+					not isBatchable(extra)
+					or extra.cancelable != item.cancelable
+					or extra.generation != item.generation
+					or extra.includesSettings != item.includesSettings
+					or size + len(extra.data) > _WRITE_BATCH_MAX_SIZE
+				):
+					heldItem = extra
+					break
+				parts.append(extra.data)
+				size += len(extra.data)
+			if len(parts) > 1:
+				item = item._replace(data=b"".join(parts))
+			return item, heldItem
+
+		heldItem: Optional[_WriteItem] = None
 		while True:
-			item = self._writeQueue.get()
+			if heldItem is not None:
+				item, heldItem = heldItem, None
+			else:
+				item = self._writeQueue.get()
 			if item is None:
 				return
-			if item.cancelable and item.generation != self._cancelGeneration:
+			if isBatchable(item):
+				# A slider flood queues many small setting commands; send them with one lock acquire
+				# and one flush.
+				item, heldItem = coalesce(item)
+			# Bind the fields read repeatedly below.
+			data = item.data
+			indexes = item.indexes
+			generation = item.generation
+			cancelable = item.cancelable
+			if cancelable and generation != self._cancelGeneration:
 				continue
 
 			if item.isMute:
@@ -1329,7 +1536,7 @@ class SynthDriver(BaseSynthDriver):
 					except Exception:
 						pass
 					try:
-						ser.write(item.data)
+						ser.write(data)
 						try:
 							ser.flush()
 						except Exception:
@@ -1338,7 +1545,7 @@ class SynthDriver(BaseSynthDriver):
 						log.debugWarning("Apollo serial mute failed", exc_info=True)
 						self._disconnect()
 						continue
-				self._suspendPollingAfterWrite(len(item.data))
+				self._suspendPollingAfterWrite(len(data))
 				continue
 
 			if item.isSettingsSync:
@@ -1351,17 +1558,17 @@ class SynthDriver(BaseSynthDriver):
 							dueAt = lastChangedAt + _SETTINGS_SYNC_DEBOUNCE_SECONDS
 							now = time.monotonic()
 							if now < dueAt:
-								time.sleep(min(0.05, dueAt - now))
+								self._stopEvent.wait(dueAt - now)
 								continue
 
 						ser = self._getSerial()
 						if ser is None:
 							if not self._ensureConnected():
-								time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+								self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 								continue
 							ser = self._getSerial()
 							if ser is None:
-								time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+								self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 								continue
 
 						startRevision = self._settingsRevision
@@ -1370,18 +1577,20 @@ class SynthDriver(BaseSynthDriver):
 						if self._needsRomSwitch:
 							if not writeBytes(
 								ser,
-								f"@={self._rom}, ".encode("ascii", "ignore") + _CR,
+								b"@=%b, %b" % (self._rom.encode("ascii", "ignore"), _CR),
 								cancelable=False,
-								generation=item.generation,
+								generation=generation,
 								flush=True,
 							):
 								continue
 							self._needsRomSwitch = False
 
-						formantDeltasSnapshot = list(self._formantDeltas)
+						formantDeltasSnapshot = self._formantDeltas
 						needsSoftReset = self._needsSoftReset
 						if needsSoftReset:
 							formantCommands = self._getFormantCommandsFromDeltas(formantDeltasSnapshot)
+						elif formantDeltasSnapshot == self._formantDeltasApplied:
+							formantCommands = []
 						else:
 							formantCommands = self._getFormantDiffCommands(
 								formantDeltasSnapshot,
@@ -1394,18 +1603,22 @@ class SynthDriver(BaseSynthDriver):
 								ser,
 								b"@J " + _CR,
 								cancelable=False,
-								generation=item.generation,
+								generation=generation,
 								flush=True,
 							):
 								continue
-						if formantCommands:
-							log.debug(f"Apollo: applying formant deltas: {''.join(formantCommands).strip()}")
+						# Skip building the message unless debug logging is on; this runs on every settings sync.
+						if formantCommands and log.isEnabledFor(logging.DEBUG):
+							log.debug(
+								"Apollo: applying formant deltas: %s",
+								b"".join(formantCommands).decode("ascii").strip(),
+							)
 
 						if not writeBytes(
 							ser,
 							self._settingsPrefix(formantCommands=formantCommands) + _CR,
 							cancelable=False,
-							generation=item.generation,
+							generation=generation,
 							flush=True,
 						):
 							continue
@@ -1416,12 +1629,10 @@ class SynthDriver(BaseSynthDriver):
 						# path-dependent tuning again).
 						if self._softResetRequestedRevision <= startRevision:
 							self._needsSoftReset = False
-						self._formantDeltasApplied = list(formantDeltasSnapshot)
+						self._formantDeltasApplied = formantDeltasSnapshot
+						# If settings changed while this sync was in flight, the debounce at the top of the loop
+						# waits for them to settle before the next pass.
 						self._needsSettingsSync = self._settingsRevision != startRevision
-
-						# Avoid busy-looping if the user is changing settings continuously.
-						if self._needsSettingsSync:
-							time.sleep(0.01)
 				finally:
 					# Allow a new sync item to be queued if needed.
 					self._settingsSyncQueued = self._needsSettingsSync
@@ -1437,16 +1648,16 @@ class SynthDriver(BaseSynthDriver):
 						ser = self._getSerial()
 						if ser is None:
 							if not self._ensureConnected():
-								time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+								self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 								continue
 							ser = self._getSerial()
 							if ser is None:
-								time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+								self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 								continue
 
 						startRevision = self._formantRevision
 						settingsRevisionSnapshot = self._settingsRevision
-						desiredSnapshot = list(self._formantDeltas)
+						desiredSnapshot = self._formantDeltas
 
 						needsSoftReset = self._needsSoftReset
 						if needsSoftReset:
@@ -1456,34 +1667,38 @@ class SynthDriver(BaseSynthDriver):
 								ser,
 								b"@J " + _CR,
 								cancelable=False,
-								generation=item.generation,
+								generation=generation,
 								flush=True,
 							):
 								continue
 
 						if needsSoftReset:
 							commands = self._getFormantCommandsFromDeltas(desiredSnapshot)
+						elif desiredSnapshot == self._formantDeltasApplied:
+							commands = []
 						else:
 							commands = self._getFormantDiffCommands(desiredSnapshot, self._formantDeltasApplied)
 
 						if commands:
-							log.debug(f"Apollo: applying formant deltas: {''.join(commands).strip()}")
+							payload = b"".join(commands)
+							if log.isEnabledFor(logging.DEBUG):
+								log.debug("Apollo: applying formant deltas: %s", payload.decode("ascii").strip())
 							if not writeBytes(
 								ser,
-								"".join(commands).encode("ascii", "ignore"),
+								payload,
 								cancelable=False,
-								generation=item.generation,
+								generation=generation,
 								flush=True,
 							):
 								continue
 
 							if self._softResetRequestedRevision <= settingsRevisionSnapshot:
 								self._needsSoftReset = False
-						self._formantDeltasApplied = list(desiredSnapshot)
+						self._formantDeltasApplied = desiredSnapshot
 						if self._formantRevision == startRevision:
 							break
 						# Avoid busy-looping if the user is changing sliders continuously.
-						time.sleep(0.01)
+						self._stopEvent.wait(0.01)
 				finally:
 					# Allow a new formant sync item to be queued if needed.
 					self._formantSyncQueued = False
@@ -1491,31 +1706,31 @@ class SynthDriver(BaseSynthDriver):
 
 			ser = self._getSerial()
 			if ser is None:
-				if item.cancelable and time.monotonic() - item.createdAt > _OFFLINE_WRITE_MAX_AGE_SECONDS:
-					if item.indexes and item.indexes[-1] == _INTERNAL_DONE_INDEX:
+				if cancelable and time.monotonic() - item.createdAt > _OFFLINE_WRITE_MAX_AGE_SECONDS:
+					if indexes and indexes[-1] == _INTERNAL_DONE_INDEX:
 						synthDoneSpeaking.notify(synth=self)
 					continue
 				if not self._ensureConnected():
-					time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+					self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 					self._writeQueue.put(item)
 					continue
 				ser = self._getSerial()
 				if ser is None:
-					time.sleep(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
+					self._stopEvent.wait(_OFFLINE_WRITE_RETRY_INTERVAL_SECONDS)
 					self._writeQueue.put(item)
 					continue
 
-			writingSpeech = bool(item.indexes) and item.cancelable and bool(item.data)
+			writingSpeech = bool(indexes) and cancelable and bool(data)
 			if writingSpeech:
 				with self._writeStateLock:
 					self._isWritingSpeech = True
 			try:
 				if not writeBytes(
 					ser,
-					item.data,
-					cancelable=item.cancelable,
-					generation=item.generation,
-					flush=not item.cancelable,
+					data,
+					cancelable=cancelable,
+					generation=generation,
+					flush=not cancelable,
 				):
 					continue
 			finally:
@@ -1523,67 +1738,108 @@ class SynthDriver(BaseSynthDriver):
 					with self._writeStateLock:
 						self._isWritingSpeech = False
 
-				if item.indexes:
+				if indexes:
 					with self._indexLock:
-						if not item.cancelable or item.generation == self._cancelGeneration:
-							self._pendingIndexes.extend(item.indexes)
+						if not cancelable or generation == self._cancelGeneration:
+							self._pendingIndexes.extend(indexes)
 							self._isSpeaking = True
+							self._pollWakeEvent.set()
 
 	def _pollLoop(self) -> None:
+		# The same query item is re-queued on every tick; it only changes after a cancel (new generation)
+		# or when reconnecting picks a different indexing command variant.
+		pollItem: Optional[_WriteItem] = None
 		while not self._stopEvent.is_set():
 			with self._pollSuspendLock:
 				suspendUntil = self._pollSuspendUntil
 			now = time.monotonic()
 			if now < suspendUntil:
-				time.sleep(min(_INDEX_POLL_INTERVAL_SECONDS, suspendUntil - now))
+				self._stopEvent.wait(min(_INDEX_POLL_INTERVAL_SECONDS, suspendUntil - now))
 				continue
 
 			shouldPoll = False
 			with self._indexLock:
-				shouldPoll = self._isSpeaking or bool(self._pendingIndexes)
+				shouldPoll = self._isSpeaking or self._pendingHead < len(self._pendingIndexes)
 
-			if shouldPoll and self._getSerial() is not None:
-				self._queueWrite(self._indexQueryCommand)
-			time.sleep(_INDEX_POLL_INTERVAL_SECONDS)
+			if not shouldPoll:
+				# Nothing to track: sleep until the write thread reports speech instead of waking up
+				# every poll interval.
+				self._pollWakeEvent.wait(_INDEX_POLL_IDLE_WAIT_SECONDS)
+				self._pollWakeEvent.clear()
+				continue
+
+			if self._getSerial() is not None:
+				generation = self._cancelGeneration
+				command = self._indexQueryCommand
+				if pollItem is None or pollItem.generation != generation or pollItem.data != command:
+					pollItem = _WriteItem(command, generation=generation, createdAt=now)
+				self._writeQueue.put(pollItem)
+			self._stopEvent.wait(_INDEX_POLL_INTERVAL_SECONDS)
 
 	def _readLoop(self) -> None:
+		# Responses are parsed out of a local buffer so one read can pick up everything the driver has
+		# received (several index responses during speech) instead of one read call per byte.
+		rxBuffer = bytearray()
+		bufferedSer = None
 		while not self._stopEvent.is_set():
 			ser = self._getSerial()
 			if ser is None:
-				time.sleep(0.1)
+				rxBuffer.clear()
+				self._stopEvent.wait(0.1)
 				continue
+			if ser is not bufferedSer:
+				rxBuffer.clear()
+				bufferedSer = ser
 			try:
-				first = ser.read(1)
+				received = ser.read(ser.in_waiting or 1)
 			except Exception:
 				log.debugWarning("Apollo serial read failed", exc_info=True)
 				self._disconnect()
-				time.sleep(0.5)
+				self._stopEvent.wait(0.5)
 				continue
 
-			if not first or first == _NAK:
+			if not received:
+				# A read timed out: drop any partial response, like the old `ser.read(3)` timeout did.
+				rxBuffer.clear()
 				continue
-
-			if first == b"I":
-				try:
-					rest = ser.read(3)
-					if len(rest) != 3:
+			rxBuffer += received
+
+			pos = 0
+			while pos < len(rxBuffer):
+				first = rxBuffer[pos]
+				if first == _RESPONSE_INDEX:
+					if len(rxBuffer) - pos < 4:
+						# Wait for the rest of the index response.
+						break
+					counter = bytes(rxBuffer[pos + 1 : pos + 3])
+					pos += 4
+					try:
+						with self._indexLock:
+							pendingCount = len(self._pendingIndexes) - self._pendingHead
+						unitsRemaining = decode_index_counter(counter, pendingCount)
+					except Exception:
 						continue
-					with self._indexLock:
-						pendingCount = len(self._pendingIndexes)
-					unitsRemaining = decode_index_counter(rest[:2], pendingCount)
-				except Exception:
+					self._lastIndexResponseTime = time.monotonic()
+					self._onUnitsRemaining(unitsRemaining)
 					continue
-				self._lastIndexResponseTime = time.monotonic()
-				self._onUnitsRemaining(unitsRemaining)
-				continue
 
-			if first == b"L":
-				self._handleLanguageListResponse(ser)
-				continue
+				if first == _RESPONSE_LANGUAGE_LIST:
+					del rxBuffer[: pos + 1]
+					pos = 0
+					# Consumes its payload from the front of rxBuffer before reading the port.
+					self._handleLanguageListResponse(ser, rxBuffer)
+					continue
+
+				# NAK, NUL and anything else we don't recognise: skip to the next response in one search
+				# rather than going around this loop once per byte.
+				match = _RESPONSE_START_RE.search(rxBuffer, pos)
+				pos = match.start() if match is not None else len(rxBuffer)
+			del rxBuffer[:pos]
 
 	def _clearIndexes(self) -> None:
 		with self._indexLock:
-			self._pendingIndexes.clear()
+			del self._pendingIndexes[:]
+			self._pendingHead = 0
 			self._isSpeaking = False
 
 	def _onUnitsRemaining(self, unitsRemaining: int) -> None:
@@ -1591,9 +1847,19 @@ class SynthDriver(BaseSynthDriver):
 		shouldNotifyDone = False
 
 		with self._indexLock:
-			while unitsRemaining < len(self._pendingIndexes):
-				reached.append(self._pendingIndexes.popleft())
-			if self._isSpeaking and not self._pendingIndexes:
+			pending = self._pendingIndexes
+			head = self._pendingHead
+			newHead = len(pending) - max(0, unitsRemaining)
+			if newHead > head:
+				reached = pending[head:newHead].tolist()
+				if newHead == len(pending):
+					del pending[:]
+					newHead = 0
+				elif newHead > len(pending) // 2:
+					del pending[:newHead]
+					newHead = 0
+				self._pendingHead = newHead
+			if self._isSpeaking and self._pendingHead == len(pending):
 				self._isSpeaking = False
 				shouldNotifyDone = True
 
@@ -1604,21 +1870,11 @@ class SynthDriver(BaseSynthDriver):
 			synthDoneSpeaking.notify(synth=self)
 
 	def _getAvailableVoices(self):
-		voices = OrderedDict()
-		# Manual: voices 1-3 are male-based, 4-6 are non-male-based.
-		#
-		# In "auto" voice filter mode, we map each voice to a distinct voice source/filter (`@$o`)
-		# so the Voice selection yields clearly different timbres on ROMs where @V voices are similar.
-		voices["1"] = VoiceInfo("1", _("Voice 1 (male default)"))
-		voices["2"] = VoiceInfo("2", _("Voice 2 (male spike)"))
-		voices["3"] = VoiceInfo("3", _("Voice 3 (male reduced high-frequency filter)"))
-		voices["4"] = VoiceInfo("4", _("Voice 4 (female default)"))
-		voices["5"] = VoiceInfo("5", _("Voice 5 (female spike)"))
-		voices["6"] = VoiceInfo("6", _("Voice 6 (female reduced high-frequency filter)"))
-		return voices
+		# NVDA caches this result on the driver; hand out a copy so the module table stays untouched.
+		return dict(_VOICES)
 
 	def _get_availablePorts(self):
-		ports: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
+		ports: dict[str, StringParameterInfo] = {}
 		ports[_AUTO_PORT] = StringParameterInfo(_AUTO_PORT, _("Auto (detect)"))
 		try:
 			try:
@@ -1640,18 +1896,7 @@ class SynthDriver(BaseSynthDriver):
 		return ports
 
 	def _get_availableBaudrates(self):
-		rates: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for rate in _SUPPORTED_BAUD_RATES:
-			key = str(rate)
-			display = f"{rate}"
-			if rate == _DEFAULT_BAUD_RATE:
-				# Translators: Shown after the baud rate that Apollo uses after power-up.
-				display = f"{rate} ({_('default')})"
-			rates[key] = StringParameterInfo(key, display)
-		current = self.baudRate
-		if current and current not in rates:
-			rates[current] = StringParameterInfo(current, current)
-		return rates
+		return _choicesWithCurrent(_BAUD_RATE_CHOICES, self.baudRate)
 
 	def _get_availableBaudRates(self):
 		return self._get_availableBaudrates()
@@ -1704,13 +1949,16 @@ class SynthDriver(BaseSynthDriver):
 		self._startBackgroundConnect()
 		self._queueSettingsSync()
 
-	def _sendSettingCommand(self, command: str) -> None:
-		if self._getSerial() is None:
+	def _sendSettingCommand(self, command: bytes) -> None:
+		# A plain attribute read is atomic; skip `_serialLock` on every slider tick. If the port drops
+		# right after this check, `_disconnect` requires a full settings sync anyway.
+		if self._serial is None:
 			self._requireSettingsSync()
 			self._queueSettingsSync()
 			return
-		# Ensure the next text doesn't accidentally join the command stream.
-		self._queueWrite((command + " ").encode("ascii", "ignore"), cancelable=False)
+		# Commands come from the module-level tables, which already end with a space so the next
+		# text doesn't accidentally join the command stream.
+		self._queueWrite(command, cancelable=False)
 
 	def _get_announceNvdaStartup(self) -> bool:
 		return self._announceNvdaStartup
@@ -1729,7 +1977,7 @@ class SynthDriver(BaseSynthDriver):
 		if any(self._formantDeltas):
 			# Switching preset voices may reset underlying formant parameters; force re-apply.
 			self._needsSoftReset = True
-			self._formantDeltasApplied = [0] * 10
+			self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 			self._softResetRequestedRevision = self._settingsRevision
 		# Selecting a preset voice can implicitly reset other voice parameters on some firmware.
 		# Always re-sync the full settings prefix to keep state deterministic (speaker table, filter,
@@ -1746,7 +1994,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._rate = rate
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@W{rate}")
+		self._sendSettingCommand(_RATE_COMMANDS[rate])
 
 	def _get_pitch(self) -> int:
 		return self._paramToPercent(self._pitch, _MIN_PITCH, _MAX_PITCH)
@@ -1757,7 +2005,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._pitch = pitch
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@F{_hexDigit(pitch)}")
+		self._sendSettingCommand(_PITCH_COMMANDS[pitch])
 
 	def _get_volume(self) -> int:
 		return self._paramToPercent(self._volume, _MIN_VOLUME, _MAX_VOLUME)
@@ -1768,7 +2016,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._volume = volume
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@A{_hexDigit(volume)}")
+		self._sendSettingCommand(_VOLUME_COMMANDS[volume])
 
 	def _get_inflection(self) -> int:
 		return self._paramToPercent(self._inflection, _MIN_INFLECTION, _MAX_INFLECTION)
@@ -1779,7 +2027,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._inflection = inflection
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@R{inflection}")
+		self._sendSettingCommand(_INFLECTION_COMMANDS[inflection])
 
 	def _get_punctuation(self) -> bool:
 		return self._punctuation
@@ -1790,7 +2038,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._punctuation = punctuation
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@P{1 if punctuation else 0}")
+		self._sendSettingCommand(_PUNCTUATION_COMMANDS[punctuation])
 
 	def _get_spellMode(self) -> bool:
 		return self._spellMode
@@ -1801,7 +2049,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._spellMode = spellMode
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@S{1 if spellMode else 0}")
+		self._sendSettingCommand(_SPELL_MODE_COMMANDS[spellMode])
 
 	def _get_hypermode(self) -> bool:
 		return self._hypermode
@@ -1812,7 +2060,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._hypermode = hypermode
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@H{1 if hypermode else 0}")
+		self._sendSettingCommand(_HYPERMODE_COMMANDS[hypermode])
 
 	def _get_phoneticMode(self) -> bool:
 		return self._phoneticMode
@@ -1823,7 +2071,7 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._phoneticMode = phoneticMode
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@X{1 if phoneticMode else 0}")
+		self._sendSettingCommand(_PHONETIC_MODE_COMMANDS[phoneticMode])
 
 	def _get_expandNumbers(self) -> bool:
 		return bool(self._expandNumbers)
@@ -1845,6 +2093,12 @@ class SynthDriver(BaseSynthDriver):
 		paramMax: int,
 		default: int,
 	) -> int:
+		# Choice IDs from the settings UI are plain decimal strings; return in-range ones directly.
+		# Numbers can't take this shortcut: they are legacy percentages, not parameter values.
+		if isinstance(value, str) and value.isdecimal():
+			parsed = int(value)
+			if paramMin <= parsed <= paramMax:
+				return parsed
 		if value is None:
 			return default
 		if isinstance(value, bool):
@@ -1884,15 +2138,7 @@ class SynthDriver(BaseSynthDriver):
 		return max(paramMin, min(paramMax, parsed))
 
 	def _get_availableMarkspaceratios(self):
-		ratios: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for ratio in range(_MIN_MARK_SPACE_RATIO, _MAX_MARK_SPACE_RATIO + 1):
-			key = str(ratio)
-			ratios[key] = StringParameterInfo(key, f"{ratio} (0x{ratio:02X})")
-
-		current = self.markSpaceRatio
-		if current and current not in ratios:
-			ratios[current] = StringParameterInfo(current, current)
-		return ratios
+		return _choicesWithCurrent(_MARK_SPACE_RATIO_CHOICES, self.markSpaceRatio)
 
 	def _get_markSpaceRatio(self) -> str:
 		return str(self._markSpaceRatio)
@@ -1908,10 +2154,10 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._markSpaceRatio = markSpaceRatio
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@M{markSpaceRatio:02X}")
+		self._sendSettingCommand(_MARK_SPACE_RATIO_COMMANDS[markSpaceRatio])
 
 	def _get_availableSpeakertables(self):
-		tables: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
+		tables: dict[str, StringParameterInfo] = {}
 		tables[_AUTO_SETTING] = StringParameterInfo(_AUTO_SETTING, _("Auto (match Voice)"))
 		tables["0"] = StringParameterInfo("0", _("Male"))
 		tables["1"] = StringParameterInfo("1", _("Non-male"))
@@ -1933,13 +2179,13 @@ class SynthDriver(BaseSynthDriver):
 		self._touchSettingsRevision()
 		if any(self._formantDeltas):
 			self._needsSoftReset = True
-			self._formantDeltasApplied = [0] * 10
+			self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 			self._softResetRequestedRevision = self._settingsRevision
 		self._requireSettingsSync()
 		self._queueSettingsSync()
 
 	def _get_availableVoicefilters(self):
-		filters: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
+		filters: dict[str, StringParameterInfo] = {}
 		filters[_AUTO_SETTING] = StringParameterInfo(_AUTO_SETTING, _("Auto (match Voice)"))
 		filters[_PRESERVE_SETTING] = StringParameterInfo(
 			_PRESERVE_SETTING,
@@ -1977,7 +2223,7 @@ class SynthDriver(BaseSynthDriver):
 		self._touchSettingsRevision()
 		if any(self._formantDeltas):
 			self._needsSoftReset = True
-			self._formantDeltasApplied = [0] * 10
+			self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 			self._softResetRequestedRevision = self._settingsRevision
 		self._requireSettingsSync()
 		self._queueSettingsSync()
@@ -1990,9 +2236,10 @@ class SynthDriver(BaseSynthDriver):
 		if value not in ("50", "255"):
 			value = str(_FORMANT_DELTA_UI_DEFAULT_MAX_ABS)
 		self._formantDeltaUiRange = value
+		self._formantDeltaUiMaxAbs = int(value)
 
 	def _get_availableFormantdeltauiranges(self):
-		ranges: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
+		ranges: dict[str, StringParameterInfo] = {}
 		ranges["50"] = StringParameterInfo("50", _("±50 (recommended, faster UI)"))
 		ranges["255"] = StringParameterInfo("255", _("±255 (full range, slower UI)"))
 		current = self.formantDeltaUiRange
@@ -2018,7 +2265,7 @@ class SynthDriver(BaseSynthDriver):
 		if current and current not in slots:
 			slots.append(current)
 
-		roms: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
+		roms: dict[str, StringParameterInfo] = {}
 		for slot in slots:
 			info = infoBySlot.get(slot)
 			if info and info.languageCode:
@@ -2049,15 +2296,7 @@ class SynthDriver(BaseSynthDriver):
 		self._disconnect()
 
 	def _get_availableSentencepauses(self):
-		pauses: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for pause in range(_MIN_SENTENCE_PAUSE, _MAX_SENTENCE_PAUSE + 1):
-			key = str(pause)
-			pauses[key] = StringParameterInfo(key, f"{pause} (0x{pause:X})")
-
-		current = self.sentencePause
-		if current and current not in pauses:
-			pauses[current] = StringParameterInfo(current, current)
-		return pauses
+		return _choicesWithCurrent(_SENTENCE_PAUSE_CHOICES, self.sentencePause)
 
 	def _get_sentencePause(self) -> str:
 		return str(self._sentencePause)
@@ -2073,18 +2312,10 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._sentencePause = sentencePause
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@D{_hexDigit(sentencePause)}")
+		self._sendSettingCommand(_SENTENCE_PAUSE_COMMANDS[sentencePause])
 
 	def _get_availableWordpauses(self):
-		pauses: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for pause in range(_MIN_WORD_PAUSE, _MAX_WORD_PAUSE + 1):
-			key = str(pause)
-			pauses[key] = StringParameterInfo(key, key)
-
-		current = self.wordPause
-		if current and current not in pauses:
-			pauses[current] = StringParameterInfo(current, current)
-		return pauses
+		return _choicesWithCurrent(_WORD_PAUSE_CHOICES, self.wordPause)
 
 	def _get_wordPause(self) -> str:
 		return str(self._wordPause)
@@ -2100,18 +2331,10 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._wordPause = wordPause
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@Q{wordPause}")
+		self._sendSettingCommand(_WORD_PAUSE_COMMANDS[wordPause])
 
 	def _get_availableVoicings(self):
-		voicings: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for voicing in range(_MIN_VOICING, _MAX_VOICING + 1):
-			key = str(voicing)
-			voicings[key] = StringParameterInfo(key, key)
-
-		current = self.voicing
-		if current and current not in voicings:
-			voicings[current] = StringParameterInfo(current, current)
-		return voicings
+		return _choicesWithCurrent(_VOICING_CHOICES, self.voicing)
 
 	def _get_voicing(self) -> str:
 		return str(self._voicing)
@@ -2127,15 +2350,15 @@ class SynthDriver(BaseSynthDriver):
 			return
 		self._voicing = voicing
 		self._touchSettingsRevision()
-		self._sendSettingCommand(f"@B{voicing}")
+		self._sendSettingCommand(_VOICING_COMMANDS[voicing])
 
-	def _getFormantCommandsFromDeltas(self, deltas: Sequence[int]) -> list[str]:
+	def _getFormantCommandsFromDeltas(self, deltas: Sequence[int]) -> list[bytes]:
 		return get_formant_commands_from_deltas(deltas)
 
-	def _getFormantCommands(self) -> list[str]:
+	def _getFormantCommands(self) -> list[bytes]:
 		return self._getFormantCommandsFromDeltas(self._formantDeltas)
 
-	def _getFormantDiffCommands(self, desired: Sequence[int], applied: Sequence[int]) -> list[str]:
+	def _getFormantDiffCommands(self, desired: Sequence[int], applied: Sequence[int]) -> list[bytes]:
 		return get_formant_diff_commands(desired, applied)
 
 	def _getEffectiveSpeakerTable(self) -> str:
@@ -2175,10 +2398,17 @@ class SynthDriver(BaseSynthDriver):
 		}
 		return mapping.get(voice, "0")
 
-	def _settingsPrefix(self, *, rom: Optional[str] = None, formantCommands: Optional[list[str]] = None) -> bytes:
+	def _settingsPrefix(self, *, rom: Optional[str] = None, formantCommands: Optional[list[bytes]] = None) -> bytes:
 		if formantCommands is None:
 			formantCommands = self._getFormantCommands()
 
+		# Everything but the formant commands depends only on settings that bump `_settingsRevision`,
+		# so repeated syncs (e.g. while a formant slider is held) reuse the last build.
+		revision = self._settingsRevision
+		cached = self._settingsPrefixCache
+		if cached is not None and cached[0] == revision:
+			return cached[1] + b"".join(formantCommands)
+
 		speakerTable = self._getEffectiveSpeakerTable()
 		voiceFilter = self._getEffectiveVoiceFilter()
 
@@ -2190,30 +2420,26 @@ class SynthDriver(BaseSynthDriver):
 			voiceFilter or "(none)",
 		)
 
-		commands: list[str] = []
-		commands.append(f"@V{self._voice} ")
-		commands.append(f"@K{speakerTable} ")
+		# Accumulate into one buffer; the settings sync runs on every voice/volume tweak.
+		commands = bytearray()
+		commands += b"@V%b @K%b " % (self._voice.encode("ascii", "ignore"), speakerTable.encode("ascii", "ignore"))
 		if voiceFilter:
-			commands.append(f"@${voiceFilter} ")
-
-		commands.extend(
-			(
-				f"@P{1 if self._punctuation else 0} ",
-				f"@S{1 if self._spellMode else 0} ",
-				f"@H{1 if self._hypermode else 0} ",
-				f"@X{1 if self._phoneticMode else 0} ",
-				f"@M{self._markSpaceRatio:02X} ",
-				f"@W{self._rate} ",
-				f"@F{_hexDigit(self._pitch)} ",
-				f"@A{_hexDigit(self._volume)} ",
-				f"@R{self._inflection} ",
-				f"@B{self._voicing} ",
-				f"@D{_hexDigit(self._sentencePause)} ",
-				f"@Q{self._wordPause} ",
-			),
-		)
-		commands.extend(formantCommands)
-		return "".join(commands).encode("ascii", "ignore")
+			commands += b"@$%b " % voiceFilter.encode("ascii", "ignore")
+		commands += _PUNCTUATION_COMMANDS[self._punctuation]
+		commands += _SPELL_MODE_COMMANDS[self._spellMode]
+		commands += _HYPERMODE_COMMANDS[self._hypermode]
+		commands += _PHONETIC_MODE_COMMANDS[self._phoneticMode]
+		commands += _MARK_SPACE_RATIO_COMMANDS[self._markSpaceRatio]
+		commands += _RATE_COMMANDS[self._rate]
+		commands += _PITCH_COMMANDS[self._pitch]
+		commands += _VOLUME_COMMANDS[self._volume]
+		commands += _INFLECTION_COMMANDS[self._inflection]
+		commands += _VOICING_COMMANDS[self._voicing]
+		commands += _SENTENCE_PAUSE_COMMANDS[self._sentencePause]
+		commands += _WORD_PAUSE_COMMANDS[self._wordPause]
+		settings = bytes(commands)
+		self._settingsPrefixCache = (revision, settings)
+		return settings + b"".join(formantCommands)
 
 	def _setFormantDelta(self, index: int, value: str | int) -> None:
 		try:
@@ -2225,13 +2451,13 @@ class SynthDriver(BaseSynthDriver):
 			return
 		if delta == self._formantDeltas[index]:
 			return
-		self._formantDeltas[index] = delta
+		self._formantDeltas = self._formantDeltas[:index] + (delta,) + self._formantDeltas[index + 1 :]
 		# These formant commands are relative (+/-) adjustments with no query API. Some ROM variants
 		# appear to clamp internal parameters; using incremental diffs can therefore become path-dependent
 		# (e.g. reaching the same displayed value via different routes yields different sound). To make
 		# tuning deterministic, always re-baseline via @J and resend the full settings.
 		self._needsSoftReset = True
-		self._formantDeltasApplied = [0] * 10
+		self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 		self._touchSettingsRevision()
 		self._softResetRequestedRevision = self._settingsRevision
 		self._requireSettingsSync()
@@ -2245,50 +2471,22 @@ class SynthDriver(BaseSynthDriver):
 	def _set_resetFormantTuning(self, value: bool) -> None:
 		if not value:
 			return
-		for i in range(len(self._formantDeltas)):
-			self._formantDeltas[i] = 0
+		self._formantDeltas = _ZERO_FORMANT_DELTAS
 
 		# Always force a soft reset so the underlying parameters return to a known baseline, even if
 		# deltas already read as 0 in NVDA (the hardware could still be modified from a previous session).
 		self._needsSoftReset = True
-		self._formantDeltasApplied = [0] * 10
+		self._formantDeltasApplied = _ZERO_FORMANT_DELTAS
 		self._touchSettingsRevision()
 		self._softResetRequestedRevision = self._settingsRevision
 		self._requireSettingsSync()
 		self._queueSettingsSync()
 
 	def _getFormantDeltaUiMaxAbs(self) -> int:
-		try:
-			maxAbs = int(self._formantDeltaUiRange)
-		except Exception:
-			maxAbs = _FORMANT_DELTA_UI_DEFAULT_MAX_ABS
-		if maxAbs not in (50, 255):
-			maxAbs = _FORMANT_DELTA_UI_DEFAULT_MAX_ABS
-		return maxAbs
+		return self._formantDeltaUiMaxAbs
 
 	def _get_availableFormantDeltaValues(self, *, maxAbs: int):
-		cache = getattr(self, "_availableFormantDeltaValuesCacheByMaxAbs", None)
-		if cache is None:
-			cache = {}
-			setattr(self, "_availableFormantDeltaValuesCacheByMaxAbs", cache)
-		cached = cache.get(maxAbs)
-		if cached is not None:
-			return cached
-
-		values: "OrderedDict[str, StringParameterInfo]" = OrderedDict()
-		for delta in range(-maxAbs, maxAbs + 1):
-			key = str(delta)
-			if delta > 0:
-				display = f"+{delta}"
-			elif delta == 0:
-				# Translators: Displayed in formant tuning lists; indicates the default (no change).
-				display = _("0 (default)")
-			else:
-				display = key
-			values[key] = StringParameterInfo(key, display)
-
-		cache[maxAbs] = values
-		return values
+		return _formantDeltaChoices(maxAbs)
 
 	def _get_availableFormantDeltaValuesForIndex(self, index: int):
 		maxAbs = self._getFormantDeltaUiMaxAbs()
@@ -2309,99 +2507,49 @@ class SynthDriver(BaseSynthDriver):
 		else:
 			display = currentKey
 
-		extended = OrderedDict(values)
-		extended[currentKey] = StringParameterInfo(currentKey, display)
-		return extended
-
-	def _get_availableFormantfndeltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(0)
-
-	def _get_availableFormantf1deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(1)
-
-	def _get_availableFormantf2deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(2)
-
-	def _get_availableFormantf3deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(3)
-
-	def _get_availableFormantalfdeltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(4)
-
-	def _get_availableFormanta1deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(5)
-
-	def _get_availableFormanta2deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(6)
-
-	def _get_availableFormanta3deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(7)
-
-	def _get_availableFormanta4deltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(8)
-
-	def _get_availableFormantivdeltas(self):
-		return self._get_availableFormantDeltaValuesForIndex(9)
-
-	def _get_formantFnDelta(self) -> str:
-		return str(int(self._formantDeltas[0]))
-
-	def _set_formantFnDelta(self, value: str | int) -> None:
-		self._setFormantDelta(0, value)
-
-	def _get_formantF1Delta(self) -> str:
-		return str(int(self._formantDeltas[1]))
-
-	def _set_formantF1Delta(self, value: str | int) -> None:
-		self._setFormantDelta(1, value)
-
-	def _get_formantF2Delta(self) -> str:
-		return str(int(self._formantDeltas[2]))
-
-	def _set_formantF2Delta(self, value: str | int) -> None:
-		self._setFormantDelta(2, value)
-
-	def _get_formantF3Delta(self) -> str:
-		return str(int(self._formantDeltas[3]))
-
-	def _set_formantF3Delta(self, value: str | int) -> None:
-		self._setFormantDelta(3, value)
-
-	def _get_formantAlfDelta(self) -> str:
-		return str(int(self._formantDeltas[4]))
+		return {**values, currentKey: StringParameterInfo(currentKey, display)}
 
-	def _set_formantAlfDelta(self, value: str | int) -> None:
-		self._setFormantDelta(4, value)
+	# One getter/setter/choices triple per formant slot, in `_formantDeltas` order. NVDA picks these
+	# up as the formant*Delta settings just like hand-written accessors.
+	_get_formantFnDelta = _formantDeltaGetter(0)
+	_set_formantFnDelta = _formantDeltaSetter(0)
+	_get_availableFormantfndeltas = _formantDeltaChoicesGetter(0)
 
-	def _get_formantA1Delta(self) -> str:
-		return str(int(self._formantDeltas[5]))
+	_get_formantF1Delta = _formantDeltaGetter(1)
+	_set_formantF1Delta = _formantDeltaSetter(1)
+	_get_availableFormantf1deltas = _formantDeltaChoicesGetter(1)
 
-	def _set_formantA1Delta(self, value: str | int) -> None:
-		self._setFormantDelta(5, value)
+	_get_formantF2Delta = _formantDeltaGetter(2)
+	_set_formantF2Delta = _formantDeltaSetter(2)
+	_get_availableFormantf2deltas = _formantDeltaChoicesGetter(2)
 
-	def _get_formantA2Delta(self) -> str:
-		return str(int(self._formantDeltas[6]))
+	_get_formantF3Delta = _formantDeltaGetter(3)
+	_set_formantF3Delta = _formantDeltaSetter(3)
+	_get_availableFormantf3deltas = _formantDeltaChoicesGetter(3)
 
-	def _set_formantA2Delta(self, value: str | int) -> None:
-		self._setFormantDelta(6, value)
+	_get_formantAlfDelta = _formantDeltaGetter(4)
+	_set_formantAlfDelta = _formantDeltaSetter(4)
+	_get_availableFormantalfdeltas = _formantDeltaChoicesGetter(4)
 
-	def _get_formantA3Delta(self) -> str:
-		return str(int(self._formantDeltas[7]))
+	_get_formantA1Delta = _formantDeltaGetter(5)
+	_set_formantA1Delta = _formantDeltaSetter(5)
+	_get_availableFormanta1deltas = _formantDeltaChoicesGetter(5)
 
-	def _set_formantA3Delta(self, value: str | int) -> None:
-		self._setFormantDelta(7, value)
+	_get_formantA2Delta = _formantDeltaGetter(6)
+	_set_formantA2Delta = _formantDeltaSetter(6)
+	_get_availableFormanta2deltas = _formantDeltaChoicesGetter(6)
 
-	def _get_formantA4Delta(self) -> str:
-		return str(int(self._formantDeltas[8]))
+	_get_formantA3Delta = _formantDeltaGetter(7)
+	_set_formantA3Delta = _formantDeltaSetter(7)
+	_get_availableFormanta3deltas = _formantDeltaChoicesGetter(7)
 
-	def _set_formantA4Delta(self, value: str | int) -> None:
-		self._setFormantDelta(8, value)
+	_get_formantA4Delta = _formantDeltaGetter(8)
+	_set_formantA4Delta = _formantDeltaSetter(8)
+	_get_availableFormanta4deltas = _formantDeltaChoicesGetter(8)
 
-	def _get_formantIvDelta(self) -> str:
-		return str(int(self._formantDeltas[9]))
-
-	def _set_formantIvDelta(self, value: str | int) -> None:
-		self._setFormantDelta(9, value)
+	_get_formantIvDelta = _formantDeltaGetter(9)
+	_set_formantIvDelta = _formantDeltaSetter(9)
+	_get_availableFormantivdeltas = _formantDeltaChoicesGetter(9)
 
 	def _queueRomInfoRequestIfNeeded(self, *, force: bool = False) -> None:
 		if self._getSerial() is None:
@@ -2419,38 +2567,42 @@ class SynthDriver(BaseSynthDriver):
 		self._suspendPolling(_ROM_INFO_REQUEST_TIMEOUT_SECONDS)
 		self._queueWrite(b"@L")
 
-	def _handleLanguageListResponse(self, ser) -> None:
+	def _handleLanguageListResponse(self, ser, buffered: bytearray) -> None:
+		# `buffered` holds bytes the read loop already received after the "L"; consume those first
+		# and leave anything past the response in place for the read loop.
 		deadline = time.monotonic() + _ROM_INFO_REQUEST_TIMEOUT_SECONDS
 
-		def readByte() -> bytes:
+		def fill() -> bool:
+			# Take whatever the port has in one read rather than a byte at a time.
 			while time.monotonic() < deadline and not self._stopEvent.is_set():
-				b = ser.read(1)
-				if b:
-					return b
-			return b""
+				chunk = ser.read(ser.in_waiting or 1)
+				if chunk:
+					buffered.extend(chunk)
+					return True
+			return False
 
 		def readSwappedHexByte() -> int:
 			digits = bytearray()
-			while len(digits) < 2 and time.monotonic() < deadline and not self._stopEvent.is_set():
-				b = readByte()
-				if not b:
-					continue
-				if b in b"0123456789abcdefABCDEF":
-					digits.extend(b)
-					continue
-			if len(digits) != 2:
-				raise TimeoutError
-			return decode_swapped_hex_byte(bytes(digits))
-
-		def readNonSeparator() -> bytes:
-			while time.monotonic() < deadline and not self._stopEvent.is_set():
-				b = readByte()
-				if not b:
-					continue
-				if b in b", \t\r\n":
-					continue
-				return b
-			return b""
+			while len(digits) < 2:
+				if not buffered and not fill():
+					raise TimeoutError
+				pos = 0
+				while pos < len(buffered) and len(digits) < 2:
+					if buffered[pos] in _HEX_DIGITS:
+						digits.append(buffered[pos])
+					pos += 1
+				del buffered[:pos]
+			return decode_swapped_hex_byte(digits)
+
+		def skipSeparators() -> bool:
+			while buffered or fill():
+				pos = 0
+				while pos < len(buffered) and buffered[pos] in _LANGUAGE_LIST_SEPARATORS:
+					pos += 1
+				del buffered[:pos]
+				if buffered:
+					return True
+			return False
 
 		try:
 			recordCount = readSwappedHexByte()
@@ -2459,18 +2611,15 @@ class SynthDriver(BaseSynthDriver):
 				return
 
 			total = recordCount * recordSize
-			firstData = readNonSeparator()
-			if not firstData:
-				return
-
-			data = bytearray(firstData)
-			while len(data) < total and time.monotonic() < deadline and not self._stopEvent.is_set():
-				chunk = ser.read(total - len(data))
-				if not chunk:
-					continue
-				data.extend(chunk)
-			if len(data) < total:
+			if not skipSeparators():
 				return
+			while len(buffered) < total:
+				if not fill():
+					# Drop the truncated records so the read loop doesn't parse them as responses.
+					buffered.clear()
+					return
+			data = bytes(buffered[:total])
+			del buffered[:total]
 		except Exception:
 			log.debugWarning("Failed to parse Apollo language list (@L) response", exc_info=True)
 			return
@@ -2480,7 +2629,7 @@ class SynthDriver(BaseSynthDriver):
 			slot = str(index + 1)
 			start = index * recordSize
 			end = start + recordSize
-			rec = bytes(data[start:end])
+			rec = data[start:end]
 
 			langCodeBytes = rec[:5]
 			languageCode = None
@@ -2514,12 +2663,12 @@ class SynthDriver(BaseSynthDriver):
 		if not requested:
 			return None
 		with self._romInfoLock:
-			infoBySlot = dict(self._romInfoBySlot)
-		if not infoBySlot:
+			slotInfos = tuple(self._romInfoBySlot.items())
+		if not slotInfos:
 			return None
 
 		requestedBase = requested.split("_")[0]
-		for slot, info in infoBySlot.items():
+		for slot, info in slotInfos:
 			candidate = _normalizeNvdaLang(info.nvdaLanguage or "")
 			if not candidate:
 				continue
@@ -2527,49 +2676,38 @@ class SynthDriver(BaseSynthDriver):
 				return slot
 		return None
 
-	def speak(self, speechSequence):
-		# Some applications call NVDA's speech API repeatedly without cancelling the previous utterance.
-		# Apollo has a sizeable internal speech buffer, so this would result in queued speech and poor
-		# responsiveness during fast navigation (e.g. pressing Down Arrow while a long message is still
-		# being spoken).
-		#
-		# To keep navigation responsive without breaking typed-character echo, automatically cancel
-		# ongoing/queued speech when a new non-trivial utterance arrives.
-		try:
-			speechSequence = tuple(speechSequence)
-		except Exception:
-			pass
-		else:
-			textChars = 0
-			shouldAutoCancel = False
-			for item in speechSequence:
-				if isinstance(item, str):
-					textChars += len(item)
-					if textChars > 1:
-						shouldAutoCancel = True
-						break
-
-			if shouldAutoCancel:
-				with self._writeStateLock:
-					inFlightSpeech = self._isWritingSpeech
-				with self._indexLock:
-					hasSpeech = self._isSpeaking or bool(self._pendingIndexes)
-				if inFlightSpeech or hasSpeech or not self._writeQueue.empty():
-					self.cancel()
+	def _cancelIfBusy(self) -> None:
+		with self._writeStateLock:
+			inFlightSpeech = self._isWritingSpeech
+		with self._indexLock:
+			hasSpeech = self._isSpeaking or self._pendingHead < len(self._pendingIndexes)
+		if inFlightSpeech or hasSpeech or not self._writeQueue.empty():
+			self.cancel()
 
+	def speak(self, speechSequence):
 		# Never block the UI thread on serial I/O. If we're disconnected, queue speech and
 		# let the background write thread establish the connection.
 		if self._getSerial() is None:
 			self._startBackgroundConnect()
 
 		indexes: list[int] = []
-		outputParts: list[bytes] = []
+		output = bytearray()
 		textBufferParts: list[str] = []
 		charModeActive = False
 		needSpaceBeforeNextText = False
 		synthSpellMode = self._spellMode
 		pendingPitchBytes: Optional[bytes] = None
 		utteranceHasContent = False
+		# Some applications call NVDA's speech API repeatedly without cancelling the previous utterance.
+		# Apollo has a sizeable internal speech buffer, so this would result in queued speech and poor
+		# responsiveness during fast navigation (e.g. pressing Down Arrow while a long message is still
+		# being spoken).
+		#
+		# To keep navigation responsive without breaking typed-character echo, automatically cancel
+		# ongoing/queued speech once the new utterance has more than one character of text. This is
+		# checked while walking the sequence below; nothing is queued until the walk is done.
+		textChars = 0
+		autoCancelChecked = False
 
 		def flushText() -> None:
 			nonlocal pendingPitchBytes
@@ -2581,26 +2719,23 @@ class SynthDriver(BaseSynthDriver):
 			if text:
 				utteranceHasContent = True
 				if pendingPitchBytes is not None:
-					outputParts.append(pendingPitchBytes)
+					output.extend(pendingPitchBytes)
 					pendingPitchBytes = None
-				outputParts.append(
+				output.extend(
 					encode_text(
 						text,
 						expand_numbers=self._expandNumbers and not (synthSpellMode or charModeActive),
 					),
 				)
 
-		if self._needsSettingsSync:
-			self._queueSettingsSync()
-
 		# Restore base rate at the start of each utterance.
 		# Some operations (e.g. @J soft reset during formant tuning) can temporarily reset speed
 		# to defaults if the device drops bytes or applies the reset asynchronously.
-		outputParts.append(f"@W{self._rate} ".encode("ascii", "ignore"))
+		output.extend(_RATE_COMMANDS[self._rate])
 
 		# Restore base pitch at the start of each utterance.
 		# Some Apollo firmware variants appear to only apply pitch at phrase boundaries.
-		outputParts.append(f"@F{_hexDigit(self._pitch)} ".encode("ascii", "ignore"))
+		output.extend(_PITCH_COMMANDS[self._pitch])
 
 		global _nvdaStartupAnnounced
 		if (
@@ -2611,25 +2746,35 @@ class SynthDriver(BaseSynthDriver):
 			textBufferParts.append("Ładowanie NVDA ")
 			_nvdaStartupAnnounced = True
 
+		# Bound once: these run for every item of long Say All sequences.
+		appendText = textBufferParts.append
+		appendIndex = indexes.append
 		for item in speechSequence:
-			if isinstance(item, str):
+			# Nearly every item is an exact str or IndexCommand; check those types by identity first.
+			itemType = type(item)
+			if itemType is str or isinstance(item, str):
+				if not autoCancelChecked:
+					textChars += len(item)
+					if textChars > 1:
+						autoCancelChecked = True
+						self._cancelIfBusy()
 				sanitized = sanitize_text(item)
 				if needSpaceBeforeNextText:
 					if sanitized:
 						if not synthSpellMode and sanitized[0].isalnum():
-							textBufferParts.append(" ")
+							appendText(" ")
 						needSpaceBeforeNextText = False
-				textBufferParts.append(sanitized)
+				appendText(sanitized)
 				if charModeActive:
 					# NVDA doesn't always send CharacterModeCommand(False); apply it only to the
 					# immediately following text chunk.
 					flushText()
 					charModeActive = False
 					needSpaceBeforeNextText = True
-			elif isinstance(item, IndexCommand):
+			elif itemType is IndexCommand or isinstance(item, IndexCommand):
 				flushText()
-				outputParts.append(self._indexMarkCommand)
-				indexes.append(item.index)
+				output.extend(self._indexMarkCommand)
+				appendIndex(item.index)
 			elif isinstance(item, CharacterModeCommand):
 				flushText()
 				if item.state:
@@ -2646,7 +2791,7 @@ class SynthDriver(BaseSynthDriver):
 					targetPitch = int(round(basePitch * float(item.multiplier)))
 				targetPitch = max(0, min(100, targetPitch))
 				apolloPitch = self._percentToParam(targetPitch, _MIN_PITCH, _MAX_PITCH)
-				pendingPitchBytes = f"@F{_hexDigit(apolloPitch)} ".encode("ascii", "ignore")
+				pendingPitchBytes = _PITCH_COMMANDS[apolloPitch]
 			elif isinstance(item, EndUtteranceCommand):
 				flushText()
 				charModeActive = False
@@ -2672,8 +2817,10 @@ class SynthDriver(BaseSynthDriver):
 					repeats = max(1, round(item.time / 100))
 					# Delimit repeated @Tx commands so they don't eat the following text/commands.
 					# Avoid literal spaces in spell/character mode (they may be spoken as "space").
-					separator = b"" if (synthSpellMode or charModeActive) else b" "
-					outputParts.append((b"@Tx" + separator) * repeats)
+					breakCommand = (
+						_BREAK_COMMAND_UNDELIMITED if (synthSpellMode or charModeActive) else _BREAK_COMMAND
+					)
+					output.extend(breakCommand * repeats)
 
 		if charModeActive:
 			flushText()
@@ -2681,9 +2828,13 @@ class SynthDriver(BaseSynthDriver):
 			needSpaceBeforeNextText = False
 		flushText()
 		# Always append a final index mark so we can reliably detect end of speech.
-		outputParts.append(self._indexMarkCommand)
+		output.extend(self._indexMarkCommand)
 		indexes.append(_INTERNAL_DONE_INDEX)
-		data = b"".join(outputParts) + _CR
+		output.extend(_CR)
+		data = bytes(output)
+		# Queue the settings sync only now, so the auto-cancel check above doesn't count it as queued speech.
+		if self._needsSettingsSync:
+			self._queueSettingsSync()
 		self._queueWrite(data, indexes=tuple(indexes))
 
 	def cancel(self):
@@ -2691,7 +2842,7 @@ class SynthDriver(BaseSynthDriver):
 		hadPendingQueue = False
 		inFlightSpeech = False
 		with self._indexLock:
-			wasSpeaking = self._isSpeaking or bool(self._pendingIndexes)
+			wasSpeaking = self._isSpeaking or self._pendingHead < len(self._pendingIndexes)
 			hadPendingQueue = not self._writeQueue.empty()
 		with self._writeStateLock:
 			inFlightSpeech = self._isWritingSpeech
@@ -2742,6 +2893,7 @@ class SynthDriver(BaseSynthDriver):
 	def terminate(self):
 		self.cancel()
 		self._stopEvent.set()
+		self._pollWakeEvent.set()
 		self._writeQueue.put(None)
 		self._disconnect()
 		super().terminate()
@@ -6,34 +6,48 @@ from typing import Sequence
 FORMANT_DELTA_HARD_MIN = -255
 FORMANT_DELTA_HARD_MAX = 255
 
+# Commands are ASCII protocol bytes; build them as bytes so callers can write them as-is.
+_SIGN_PLUS = b"+"
+_SIGN_MINUS = b"-"
 
-def get_formant_commands_from_deltas(deltas: Sequence[int]) -> list[str]:
-	commands: list[str] = []
-	for index, delta in enumerate(deltas):
-		if not delta:
-			continue
-		delta_int = max(FORMANT_DELTA_HARD_MIN, min(FORMANT_DELTA_HARD_MAX, int(delta)))
-		sign = "+" if delta_int > 0 else "-"
-		hh = min(0xFF, abs(delta_int))
-		commands.append(f"@u{index}{hh:02X}{sign} ")
-	return commands
+
+# Deltas are clamped to +/-255 per index, so the set of distinct commands is small; format each once.
+_FORMANT_COMMAND_CACHE: dict[tuple[int, int], bytes] = {}
+
+
+def _formant_command(index: int, delta: int) -> bytes:
+	key = (index, delta)
+	command = _FORMANT_COMMAND_CACHE.get(key)
+	if command is None:
+		sign = _SIGN_PLUS if delta > 0 else _SIGN_MINUS
+		command = b"@u%d%02X%b " % (index, min(0xFF, abs(delta)), sign)
+		_FORMANT_COMMAND_CACHE[key] = command
+	return command
+
+
+def get_formant_commands_from_deltas(deltas: Sequence[int]) -> list[bytes]:
+	return [
+		_formant_command(index, max(FORMANT_DELTA_HARD_MIN, min(FORMANT_DELTA_HARD_MAX, int(delta))))
+		for index, delta in enumerate(deltas)
+		if delta
+	]
 
 
-def get_formant_adjust_commands(index: int, diff: int) -> list[str]:
+def get_formant_adjust_commands(index: int, diff: int) -> list[bytes]:
 	if not diff:
 		return []
-	sign = "+" if diff > 0 else "-"
+	step = 0xFF if diff > 0 else -0xFF
 	remaining = abs(int(diff))
-	commands: list[str] = []
-	while remaining > 0:
-		chunk = min(0xFF, remaining)
-		commands.append(f"@u{index}{chunk:02X}{sign} ")
-		remaining -= chunk
+	commands: list[bytes] = []
+	while remaining > 0xFF:
+		commands.append(_formant_command(index, step))
+		remaining -= 0xFF
+	commands.append(_formant_command(index, remaining if diff > 0 else -remaining))
 	return commands
 
 
-def get_formant_diff_commands(desired: Sequence[int], applied: Sequence[int]) -> list[str]:
-	commands: list[str] = []
+def get_formant_diff_commands(desired: Sequence[int], applied: Sequence[int]) -> list[bytes]:
+	commands: list[bytes] = []
 	for index, delta in enumerate(desired):
 		try:
 			current = int(applied[index])
@@ -1,6 +1,11 @@
 # -*- coding: UTF-8 -*-
 from __future__ import annotations
 
+# Byte value -> hex nibble, or -1 for anything that is not an ASCII hex digit.
+_HEX_NIBBLES: tuple[int, ...] = tuple(
+	int(chr(byte), 16) if chr(byte) in "0123456789abcdefABCDEF" else -1 for byte in range(256)
+)
+
 
 def decode_swapped_hex_byte(two_ascii_hex_digits: bytes) -> int:
 	"""
@@ -8,8 +13,11 @@ def decode_swapped_hex_byte(two_ascii_hex_digits: bytes) -> int:
 	"""
 	if len(two_ascii_hex_digits) != 2:
 		raise ValueError("Expected 2 ASCII hex digits")
-	normalized = bytes((two_ascii_hex_digits[1], two_ascii_hex_digits[0])).upper()
-	return int(normalized.decode("ascii"), 16)
+	low = _HEX_NIBBLES[two_ascii_hex_digits[0]]
+	high = _HEX_NIBBLES[two_ascii_hex_digits[1]]
+	if low < 0 or high < 0:
+		raise ValueError("Expected 2 ASCII hex digits")
+	return (high << 4) | low
 
 
 def decode_index_counter(two_ascii_hex_digits: bytes, pending_count: int) -> int:
@@ -19,14 +27,21 @@ def decode_index_counter(two_ascii_hex_digits: bytes, pending_count: int) -> int
 	"""
 	if len(two_ascii_hex_digits) != 2:
 		raise ValueError("Expected 2 ASCII hex digits")
-	try:
-		normal = int(two_ascii_hex_digits.decode("ascii"), 16)
-	except Exception:
-		normal = 0
-	try:
-		swapped = decode_swapped_hex_byte(two_ascii_hex_digits)
-	except Exception:
-		swapped = normal
+	first = _HEX_NIBBLES[two_ascii_hex_digits[0]]
+	second = _HEX_NIBBLES[two_ascii_hex_digits[1]]
+	if first >= 0 and second >= 0:
+		normal = (first << 4) | second
+		swapped = (second << 4) | first
+	else:
+		# Not two hex digits; `int` still accepts padded/signed counters such as b" 5" or b"+5".
+		try:
+			normal = int(two_ascii_hex_digits.decode("ascii"), 16)
+		except Exception:
+			normal = 0
+		try:
+			swapped = int(bytes((two_ascii_hex_digits[1], two_ascii_hex_digits[0])).decode("ascii"), 16)
+		except Exception:
+			swapped = normal
 
 	candidates_in_range = [v for v in (normal, swapped) if 0 <= v <= pending_count]
 	if candidates_in_range:
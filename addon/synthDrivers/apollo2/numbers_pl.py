@@ -1,5 +1,8 @@
 ﻿# -*- coding: utf-8 -*-
 # begin of say polish numbers
+import functools
+import re
+
 def dajDlugoscNapisu(napis):
  dlugosc=len(napis)
  return dlugosc
@@ -71,55 +74,51 @@ def dajLiczbeBezNieznaczacychZerNaPoczatku(napis):
   napis_1=dajFragmentNapisu(napis, indeks, dlugosc-indeks+1)
  return napis_1
 
+_CYFRY={
+ '0': 'zero',
+ '1': 'jeden',
+ '2': 'dwa',
+ '3': 'trzy',
+ '4': 'cztery',
+ '5': 'pięć',
+ '6': 'sześć',
+ '7': 'siedem',
+ '8': 'osiem',
+ '9': 'dziewięć',
+}
+
 def dajPostacSlownaJednejCyfry(znak):
- napis=''
- if znak=='0':
-  napis='zero'
- if znak=='1':
-  napis='jeden'
- if znak=='2':
-  napis='dwa'
- if znak=='3':
-  napis='trzy'
- if znak=='4':
-  napis='cztery'
- if znak=='5':
-  napis='pięć'
- if znak=='6':
-  napis='sześć'
- if znak=='7':
-  napis='siedem'
- if znak=='8':
-  napis='osiem'
- if znak=='9':
-  napis='dziewięć'
- return napis
+ return _CYFRY.get(znak, '')
+
+_DZIESIATKI={
+ '1': 'dziesięć',
+ '2': 'dwadzieścia',
+ '3': 'trzydzieści',
+ '4': 'czterdzieści',
+ '5': 'pięćdziesiąt',
+ '6': 'sześćdziesiąt',
+ '7': 'siedemdziesiąt',
+ '8': 'osiemdziesiąt',
+ '9': 'dziewięćdziesiąt',
+}
 
 def dajPostacSlownaDziesiatki(znak):
- napis=''
- if znak=='1':
-  napis='dziesięć'
- if znak=='2':
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'dzieścia')
- if znak=='3':
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'dzieści')
- if znak=='4':
-  napis=dajPolaczoneNapisy(dajFragmentNapisu(dajPostacSlownaJednejCyfry(znak), 1, dajDlugoscNapisu(dajPostacSlownaJednejCyfry(znak))-1), 'dzieści')
- if (znak>='5') and (znak<='9'):
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'dziesiąt')
- return napis
+ return _DZIESIATKI.get(znak, '')
+
+_NASCIE={
+ '1': 'jedenaście',
+ '2': 'dwanaście',
+ '3': 'trzynaście',
+ '4': 'czternaście',
+ '5': 'piętnaście',
+ '6': 'szesnaście',
+ '7': 'siedemnaście',
+ '8': 'osiemnaście',
+ '9': 'dziewiętnaście',
+}
 
 def dajPostacSlownaNascie(znak):
- napis=''
- if (znak=='1') or (znak=='4'):
-  napis=dajPolaczoneNapisy(dajFragmentNapisu(dajPostacSlownaJednejCyfry(znak), 1, dajDlugoscNapisu(dajPostacSlownaJednejCyfry(znak))-1), 'naście')
- if (znak=='2') or (znak=='3') or (znak=='7') or (znak=='8'):
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'naście')
- if znak=='6':
-  napis='szesnaście'
- if (znak=='5') or (znak=='9'):
-  napis=dajPolaczoneNapisy(dajFragmentNapisu(dajPostacSlownaJednejCyfry(znak), 1, dajDlugoscNapisu(dajPostacSlownaJednejCyfry(znak))-1), 'tnaście')
- return napis
+ return _NASCIE.get(znak, '')
 
 def dajPostacSlownaLiczbyDwucyfrowej(napis):
  napis_1=''
@@ -148,17 +147,20 @@ def dajPostacSlownaLiczbyDwucyfrowej(napis):
        napis_1=dajPolaczoneNapisy(dajPolaczoneNapisy(napis_2, ' '), napis_3)
  return napis_1
 
+_SETKI={
+ '1': 'sto',
+ '2': 'dwieście',
+ '3': 'trzysta',
+ '4': 'czterysta',
+ '5': 'pięćset',
+ '6': 'sześćset',
+ '7': 'siedemset',
+ '8': 'osiemset',
+ '9': 'dziewięćset',
+}
+
 def dajPostacSlownaSetki(znak):
- napis=''
- if znak=='1':
-  napis='sto'
- if znak=='2':
-  napis='dwieście'
- if (znak=='3') or (znak=='4'):
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'sta')
- if (znak>='5') and (znak<='9'):
-  napis=dajPolaczoneNapisy(dajPostacSlownaJednejCyfry(znak), 'set')
- return napis
+ return _SETKI.get(znak, '')
 
 def dajPostacSlownaLiczbyTrzycyfrowej(napis):
  napis_1=''
@@ -300,47 +302,33 @@ def dajOdmianeCentyliona(znak):
  odmiana=dajOdmianeLiona('centy', znak)
  return odmiana
 
+# Indexed by group counter: 0 = thousands, 1 = millions, 2 = milliards, ...
+_ODMIANY_TYSIECY=(
+ dajOdmianeTysiaca,
+ dajOdmianeMiliona,
+ dajOdmianeMiliarda,
+ dajOdmianeBiliona,
+ dajOdmianeBiliarda,
+ dajOdmianeTryliona,
+ dajOdmianeTryliarda,
+ dajOdmianeKwadryliona,
+ dajOdmianeKwadryliarda,
+ dajOdmianeKwintyliona,
+ dajOdmianeKwintyliarda,
+ dajOdmianeSekstyliona,
+ dajOdmianeSeptyliona,
+ dajOdmianeOktyliona,
+ dajOdmianeNonyliona,
+ dajOdmianeDecyliona,
+ dajOdmianeUndecyliona,
+ dajOdmianeDuodecyliona,
+ dajOdmianeCentyliona,
+)
+
 def dajOdmianeTysiecy(znak, licznik):
  odmiana=''
- if (znak>='0') and (znak<='9'):
-  if licznik==0:
-   odmiana=dajOdmianeTysiaca(znak)
-  if licznik==1:
-   odmiana=dajOdmianeMiliona(znak)
-  if licznik==2:
-   odmiana=dajOdmianeMiliarda(znak)
-  if licznik==3:
-   odmiana=dajOdmianeBiliona(znak)
-  if licznik==4:
-   odmiana=dajOdmianeBiliarda(znak)
-  if licznik==5:
-   odmiana=dajOdmianeTryliona(znak)
-  if licznik==6:
-   odmiana=dajOdmianeTryliarda(znak)
-  if licznik==7:
-   odmiana=dajOdmianeKwadryliona(znak)
-  if licznik==8:
-   odmiana=dajOdmianeKwadryliarda(znak)
-  if licznik==9:
-   odmiana=dajOdmianeKwintyliona(znak)
-  if licznik==10:
-   odmiana=dajOdmianeKwintyliarda(znak)
-  if licznik==11:
-   odmiana=dajOdmianeSekstyliona(znak)
-  if licznik==12:
-   odmiana=dajOdmianeSeptyliona(znak)
-  if licznik==13:
-   odmiana=dajOdmianeOktyliona(znak)
-  if licznik==14:
-   odmiana=dajOdmianeNonyliona(znak)
-  if licznik==15:
-   odmiana=dajOdmianeDecyliona(znak)
-  if licznik==16:
-   odmiana=dajOdmianeUndecyliona(znak)
-  if licznik==17:
-   odmiana=dajOdmianeDuodecyliona(znak)
-  if licznik==18:
-   odmiana=dajOdmianeCentyliona(znak)
+ if (znak>='0') and (znak<='9') and (0<=licznik<len(_ODMIANY_TYSIECY)):
+  odmiana=_ODMIANY_TYSIECY[licznik](znak)
  return odmiana
 
 def dajGrupe(wartoscGrupy):
@@ -365,6 +353,8 @@ def podpiszGrupe(numerGrupy, wartoscGrupy):
   napis=dajOdmianeTysiecy(znak, numerGrupy-2)
  return napis
 
+# Numbers repeat a lot in spoken text (list positions, times, small counts); spell each digit run once.
+@functools.lru_cache(maxsize=4096)
 def dajNapisZLiczbaWPostaciSlownej(napis):
  napis_1=''
  dlugosc=0
@@ -395,44 +385,15 @@ def dajNapisZLiczbaWPostaciSlownej(napis):
     napis_1=dajPolaczoneNapisy(napis_1, podpiszGrupe((ileGrup-numerGrupy+1), wartoscGrupy))
  return napis_1
 
+_CIAG_CYFR = re.compile('[0-9]+')
+
+def _dajCiagCyfrWPostaciSlownej(dopasowanie):
+ cyfry=dopasowanie.group()
+ bezZer=cyfry.lstrip('0')
+ # Leading zeros are read one by one, then the rest as a single number.
+ return " zero "*(len(cyfry)-len(bezZer))+dajNapisZLiczbaWPostaciSlownej(bezZer)
+
 def dajNapisZLiczbamiWPostaciSlownej(napis):
- napis_1=''
- poprzedni=0
- indeks=1
- dlugosc=dajDlugoscNapisu(napis)
- znak=chr(0)
- jeszcze=False
- while indeks<=dlugosc:
-  poprzedni=indeks
-  jeszcze=True
-  while (indeks<=dlugosc) and jeszcze:
-   znak=dajZnakNapisu(napis, indeks)
-   if (str(znak)>='0') and (str(znak)<='9'):
-    jeszcze=False
-   else:
-    indeks=indeks+1
-  napis_1=dajPolaczoneNapisy(napis_1, dajFragmentNapisu(napis, poprzedni, indeks-poprzedni))
-  poprzedni=indeks
-  jeszcze=True
-  while (indeks<=dlugosc) and jeszcze:
-   znak=dajZnakNapisu(napis, indeks)
-   if (str(znak)=='0'):
-    indeks=indeks+1
-    napis_1=napis_1+" zero "
-   else:
-    jeszcze=False
-  poprzedni=indeks
-  jeszcze=True
-  while (indeks<=dlugosc) and jeszcze:
-   znak=dajZnakNapisu(napis, indeks)
-   if (str(znak)>='0') and (str(znak)<='9'):
-    indeks=indeks+1
-   else:
-    jeszcze=False
-# if (indeks-poprzedni)==1:
-#  napis_1=dajPolaczoneNapisy(napis_1, (dajFragmentNapisu(napis, poprzedni, (indeks-poprzedni))))
-# else:
-  napis_1=dajPolaczoneNapisy(napis_1, dajNapisZLiczbaWPostaciSlownej(dajFragmentNapisu(napis, poprzedni, (indeks-poprzedni))))
- return napis_1
+ return _CIAG_CYFR.sub(_dajCiagCyfrWPostaciSlownej, napis)
 
 # end of say polish numbers
@@ -11,6 +11,6 @@ MUTE = b"\x18"
 # Earlier driver iterations found that the "@1?" / "@1+" variant could result in stray "1"
 # announcements on some firmware, so we stick to the "@I?" / "@I+" form.
 INDEX_QUERY_COMMAND = b"@I?"
-INDEX_ENABLE_COMMAND = b"@I+ "
-INDEX_MARK_COMMAND = b"@I+ "
+# Enabling indexing and inserting a mark are the same command; share one object.
+INDEX_ENABLE_COMMAND = INDEX_MARK_COMMAND = b"@I+ "
 
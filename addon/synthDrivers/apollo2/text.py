@@ -1,6 +1,7 @@
 # -*- coding: UTF-8 -*-
 from __future__ import annotations
 
+import functools
 import re
 
 from . import numbers_pl
@@ -60,21 +61,60 @@ _ISOLATED_DIGIT_FIXES_PL: dict[str, str] = {
 }
 
 _ISOLATED_DIGIT_PATTERN = re.compile(r"^\s*([69])\s*$")
+_DIGITS_RE = re.compile(r"[0-9]")
+
+
+# Apollo uses @-prefixed commands; don't allow those to leak from NVDA text.
+# Normalize all whitespace/control chars to ASCII space to avoid word-join bugs
+# (e.g. tabs / non-breaking spaces not treated as separators by the synth).
+# U+3000 (ideographic space) is the highest code point `str.isspace()` accepts.
+_SANITIZE_TRANSLATION: dict[int, str] = {
+	cp: " " for cp in range(0x3001) if cp < 0x20 or cp == 0x7F or (cp != 0x20 and chr(cp).isspace())
+}
+_SANITIZE_TRANSLATION[ord("@")] = " "
+# Matches any character the translation would change; most strings contain none.
+_SANITIZE_DIRTY_RE = re.compile(
+	"[" + "".join(re.escape(chr(cp)) for cp in sorted(_SANITIZE_TRANSLATION)) + "]",
+)
+
+
+# NVDA speaks the same short strings over and over while navigating (control roles, "OK", single
+# characters), so both steps cache recent results for those. Longer text (Say All paragraphs) rarely
+# repeats and would only pin memory, so it bypasses the caches.
+_CACHED_TEXT_MAX_LENGTH = 64
 
 
 def sanitize_text(text: str) -> str:
+	if len(text) <= _CACHED_TEXT_MAX_LENGTH:
+		return _sanitize_text_cached(text)
+	return _sanitize_text(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_text_cached(text: str) -> str:
+	return _sanitize_text(text)
+
+
+def _sanitize_text(text: str) -> str:
 	if not text:
 		return ""
-	# Apollo uses @-prefixed commands; don't allow those to leak from NVDA text.
-	text = text.replace("@", " ")
-	# Normalize all whitespace/control chars to ASCII space to avoid word-join bugs
-	# (e.g. tabs / non-breaking spaces not treated as separators by the synth).
-	return "".join(
-		" " if (ch.isspace() or ord(ch) < 0x20 or ord(ch) == 0x7F) else ch for ch in text
-	)
+	if _SANITIZE_DIRTY_RE.search(text) is None:
+		return text
+	return text.translate(_SANITIZE_TRANSLATION)
 
 
 def encode_text(text: str, *, expand_numbers: bool = True) -> bytes:
+	if len(text) <= _CACHED_TEXT_MAX_LENGTH:
+		return _encode_text_cached(text, expand_numbers)
+	return _encode_text(text, expand_numbers)
+
+
+@functools.lru_cache(maxsize=2048)
+def _encode_text_cached(text: str, expand_numbers: bool) -> bytes:
+	return _encode_text(text, expand_numbers)
+
+
+def _encode_text(text: str, expand_numbers: bool) -> bytes:
 	# Workaround: some Apollo ROMs mispronounce isolated digits "6" and "9" (e.g. "szeszcz", "dziewęć").
 	# Only fix the digit-in-isolation case to avoid changing numbers in context (e.g. "66" or "Za 6 dni").
 	match = _ISOLATED_DIGIT_PATTERN.match(text)
@@ -85,7 +125,11 @@ def encode_text(text: str, *, expand_numbers: bool = True) -> bytes:
 			start, end = match.span(1)
 			text = text[:start] + replacement + text[end:]
 
-	if expand_numbers and any("0" <= ch <= "9" for ch in text):
+	if expand_numbers and _DIGITS_RE.search(text):
 		text = numbers_pl.dajNapisZLiczbamiWPostaciSlownej(text)
+	if text.isascii():
+		# The translation table only remaps bytes >= 0x80, so ASCII passes through unchanged.
+		return text.encode("ascii")
 	cp1250 = text.encode("cp1250", "replace")
 	return cp1250.translate(POLISH_TO_APOLLO_TRANSLATION)
+
@@ -156,21 +156,30 @@ class DriverStructureTests(unittest.TestCase):
 		self.assertIsNotNone(settings_prefix, "_settingsPrefix method not found in SynthDriver")
 
 		def _is_unconditional_at_dollar_append(stmt: ast.stmt) -> bool:
-			if not isinstance(stmt, ast.Expr):
+			# Matches `commands.append(...)` as well as `commands += ...`.
+			if isinstance(stmt, ast.Expr):
+				call = stmt.value
+				if not isinstance(call, ast.Call):
+					return False
+				func = call.func
+				if not (isinstance(func, ast.Attribute) and func.attr == "append"):
+					return False
+				if not (isinstance(func.value, ast.Name) and func.value.id == "commands"):
+					return False
+				if not call.args:
+					return False
+				appended = call.args[0]
+			elif isinstance(stmt, ast.AugAssign) and isinstance(stmt.op, ast.Add):
+				if not (isinstance(stmt.target, ast.Name) and stmt.target.id == "commands"):
+					return False
+				appended = stmt.value
+			else:
 				return False
-			call = stmt.value
-			if not isinstance(call, ast.Call):
-				return False
-			func = call.func
-			if not (isinstance(func, ast.Attribute) and func.attr == "append"):
-				return False
-			if not (isinstance(func.value, ast.Name) and func.value.id == "commands"):
-				return False
-			if not call.args:
-				return False
-			for n in ast.walk(call.args[0]):
+			for n in ast.walk(appended):
 				if isinstance(n, ast.Constant) and isinstance(n.value, str) and "@$" in n.value:
 					return True
+				if isinstance(n, ast.Constant) and isinstance(n.value, bytes) and b"@$" in n.value:
+					return True
 			return False
 
 		unconditional = [stmt for stmt in settings_prefix.body if _is_unconditional_at_dollar_append(stmt)]
@@ -19,6 +19,13 @@ class IndexingTests(unittest.TestCase):
 		with self.assertRaises(ValueError):
 			decode_swapped_hex_byte(b"000")
 
+	def test_decode_swapped_hex_byte_rejects_non_hex_digits(self) -> None:
+		self.assertEqual(decode_swapped_hex_byte(b"a0"), 0x0A)
+		with self.assertRaises(ValueError):
+			decode_swapped_hex_byte(b"0G")
+		with self.assertRaises(ValueError):
+			decode_swapped_hex_byte(b"\xff0")
+
 	def test_decode_index_counter_prefers_candidate_within_range(self) -> None:
 		# Normal would be 0x40=64; swapped is 0x04=4. With only 10 pending, pick 4.
 		self.assertEqual(decode_index_counter(b"40", pending_count=10), 4)
@@ -34,6 +41,15 @@ class IndexingTests(unittest.TestCase):
 		self.assertEqual(decode_index_counter(b"F0", pending_count=100), 15)
 		self.assertEqual(decode_index_counter(b"0F", pending_count=20), 15)
 
+	def test_decode_index_counter_reads_non_hex_as_zero(self) -> None:
+		self.assertEqual(decode_index_counter(b"ZZ", pending_count=10), 0)
+		self.assertEqual(decode_index_counter(b"1Z", pending_count=10), 0)
+
+	def test_decode_index_counter_accepts_padded_or_signed_counters(self) -> None:
+		self.assertEqual(decode_index_counter(b" 5", pending_count=10), 5)
+		self.assertEqual(decode_index_counter(b"5 ", pending_count=10), 5)
+		self.assertEqual(decode_index_counter(b"+5", pending_count=10), 5)
+
 	def test_decode_index_counter_requires_two_digits(self) -> None:
 		with self.assertRaises(ValueError):
 			decode_index_counter(b"F", pending_count=0)
@@ -16,6 +16,7 @@ class ProtocolTests(unittest.TestCase):
 		self.assertEqual(protocol.INDEX_QUERY_COMMAND, b"@I?")
 		self.assertEqual(protocol.INDEX_ENABLE_COMMAND, b"@I+ ")
 		self.assertEqual(protocol.INDEX_MARK_COMMAND, b"@I+ ")
+		self.assertIs(protocol.INDEX_MARK_COMMAND, protocol.INDEX_ENABLE_COMMAND)
 		self.assertNotEqual(protocol.INDEX_QUERY_COMMAND, b"@1?")
 
 
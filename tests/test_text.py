@@ -14,11 +14,16 @@ class TextTests(unittest.TestCase):
 		self.assertEqual(sanitize_text("a\tb\nc"), "a b c")
 		self.assertEqual(sanitize_text("a\u00A0b"), "a b")
 		self.assertEqual(sanitize_text("a\x00b\x7f"), "a b ")
+		self.assertEqual(sanitize_text("a\u2028b\u3000c\x85d"), "a b c d")
+		self.assertEqual(sanitize_text("zażółć gęślą"), "zażółć gęślą")
+
+	def test_sanitize_text_handles_long_text(self) -> None:
+		self.assertEqual(sanitize_text("a@b\t" * 100), "a b " * 100)
 
 	def test_encode_text_expands_numbers(self) -> None:
 		self.assertEqual(encode_text("1"), b"jeden")
 		expanded = encode_text("Za 2 dni")
-		self.assertFalse(any(0x30 <= b <= 0x39 for b in expanded))
+		self.assertEqual(expanded.translate(None, b"0123456789"), expanded)
 
 	def test_encode_text_can_skip_number_expansion(self) -> None:
 		self.assertEqual(encode_text("1", expand_numbers=False), b"1")
@@ -31,6 +36,9 @@ class TextTests(unittest.TestCase):
 		self.assertEqual(encode_text("6", expand_numbers=False), encode_text("sześć", expand_numbers=False))
 		self.assertEqual(encode_text("9", expand_numbers=False), encode_text("dziewięć", expand_numbers=False))
 
+	def test_encode_text_handles_long_text(self) -> None:
+		self.assertEqual(encode_text("ą 1 " * 50), encode_text("ą 1 ") * 50)
+
 	def test_encode_text_does_not_fix_non_isolated_digits(self) -> None:
 		self.assertEqual(encode_text("66", expand_numbers=False), b"66")
 		self.assertIn(b"6", encode_text("Za 6 dni", expand_numbers=False))